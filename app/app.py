@@ -1,10 +1,16 @@
+import asyncio
 from typing import Optional
 
+from core import get_config
+from core.database_manager.base_database_handler import BaseDatabaseHandler, ConfigDatabaseLoader, DatabaseConfig
 from core.database_manager.creator_database import CreatorDatabase
+from core.database_manager.db_players_handler import DatabaseQuizPlayerHandler
 from core.engine import EngineBot
 from errors import ErrorCode
 from logger import Logger
 
+logger = Logger().get_logger()
+
 
 class Application:
     """
@@ -16,25 +22,41 @@ class Application:
         """
         Конструктор приложения
         """
+        self._engine = None
 
-        self._engine = EngineBot()
+    @property
+    def engine(self) -> EngineBot:
+        """
+        Движок бота (создается при первом обращении)
+        """
+        if self._engine is None:
+            self._engine = EngineBot()
+        return self._engine
 
     async def _init(self) -> ErrorCode:
-        if await self._init_db() != ErrorCode.SUCCESSFUL:
-            Logger().get_logger().error("Ошибка инициализации БД")
+        # Движку нужен токен из БД, поэтому параллельно читаются только конфиги
+        db_config_loader, _ = await asyncio.gather(
+            ConfigDatabaseLoader.create(),
+            get_config().load()
+        )
+
+        if await self._init_db(db_config_loader.get("db_config")) != ErrorCode.SUCCESSFUL:
+            logger.error("Ошибка инициализации БД")
             return ErrorCode.FAILED_ERROR
 
-        if await self._engine.init() != ErrorCode.SUCCESSFUL:
-            Logger().get_logger().error("Ошибка инициализации Движка")
+        if await self.engine.init() != ErrorCode.SUCCESSFUL:
+            logger.error("Ошибка инициализации Движка")
             return ErrorCode.FAILED_ERROR
 
         return ErrorCode.SUCCESSFUL
 
-    async def _init_db(self) -> ErrorCode:
+    async def _init_db(self, db_config: DatabaseConfig) -> ErrorCode:
         """
         Инициализация БД и таблиц
+
+        :param db_config: Конфигурация БД
         """
-        creator_db = CreatorDatabase()
+        creator_db = CreatorDatabase(db_config)
         if await creator_db.init_db():
             return ErrorCode.SUCCESSFUL
         else:
@@ -44,11 +66,17 @@ class Application:
         """
         Запуск бота
         """
-        Logger().get_logger().info("Запуск бота...")
-        if await self._init() != ErrorCode.SUCCESSFUL:
-            Logger().get_logger().info("Ошибка запуска бота...")
-            return ErrorCode.FAILED_ERROR
+        logger.info("Запуск бота...")
+        # Пулы соединений открываются уже при инициализации, поэтому закрываются при любом исходе
+        try:
+            if await self._init() != ErrorCode.SUCCESSFUL:
+                logger.info("Ошибка запуска бота...")
+                return ErrorCode.FAILED_ERROR
 
-        await self._engine.start()
-        Logger().get_logger().info("Бот запущен")
+            await self.engine.start()
+            logger.info("Бот запущен")
+        finally:
+            # Файлы фото, поставленные в очередь на удаление, удаляются до выхода
+            await DatabaseQuizPlayerHandler.stop_photo_deleters()
+            await BaseDatabaseHandler.close()
         return ErrorCode.SUCCESSFUL
@@ -1,5 +1,10 @@
 import asyncio
 
+try:
+    import uvloop
+except ImportError:  # uvloop недоступен (например, на Windows)
+    uvloop = None
+
 from app import Application
 from core.routers import StartRouter
 from errors import ErrorCode
@@ -15,4 +20,7 @@ async def run():
         print("Бот не запустился")
 
 if __name__ == "__main__":
-    asyncio.run(run())
+    if uvloop is not None:
+        uvloop.run(run())
+    else:
+        asyncio.run(run())
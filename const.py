@@ -31,3 +31,8 @@ LOCALE_BUTTONS = LOCALE_CONFIGS / "locale.buttons.json"
 
 
 PathLike = Union[Path, str]
+
+
+# Строковые формы путей к конфигам (передаются в загрузчики без повторного os.fspath)
+CONFIG_BOT_STR = str(CONFIG_BOT)
+BD_CONFIG_STR = str(BD_CONFIG)
@@ -1 +1 @@
-from .config import Config
+from .config import Config, get_config
@@ -1,8 +1,9 @@
+import functools
 from dataclasses import dataclass
+from typing import Optional
 
-from const import CONFIG_BOT
-from _singleton import Singleton
-from utils import load_config
+from const import CONFIG_BOT_STR
+from utils import load_config, load_config_async
 
 
 @dataclass
@@ -14,21 +15,42 @@ class ConfigBot:
     token: str
     # ID администраторов
     admin_ids: list[int]
+    # Таймаут long polling в секундах (сколько Telegram держит запрос getUpdates без новых апдейтов)
+    polling_timeout: int = 30
 
 
 class ConfigBotLoader(dict):
     """
     Загрузчик основных настроек бота
     """
-    def __init__(self, config_file: str = None) -> None:
+    def __init__(self, config_file: str = None, config_data: Optional[dict] = None) -> None:
+        """
+        Создает загрузчик настроек бота
+
+        :param config_file: Файл конфига в json формате
+        :param config_data: Уже прочитанные данные конфига (файл не читается повторно)
+        """
         super().__init__()
-        self.config = config_file or CONFIG_BOT
+        self.config = config_file or CONFIG_BOT_STR
 
-        for key, value in load_config(self.config).items():
+        if config_data is None:
+            config_data = load_config(self.config)
+
+        for key, value in config_data.items():
             self[key] = ConfigBot(**value)
 
+    @classmethod
+    async def create(cls, config_file: str = None) -> "ConfigBotLoader":
+        """
+        Создает загрузчик, читая конфиг без блокировки цикла событий
 
-class Config(metaclass=Singleton):
+        :param config_file: Файл конфига в json формате
+        """
+        config_data = await load_config_async(config_file or CONFIG_BOT_STR)
+        return cls(config_file, config_data=config_data)
+
+
+class Config:
     """
     Основные настройки бота
     """
@@ -38,12 +60,29 @@ class Config(metaclass=Singleton):
 
         :param config_file: Файл конфига в json формате
         """
-        self._config_loader = ConfigBotLoader(config_file)
+        self._config_file = config_file
+        self._config_loader: Optional[ConfigBotLoader] = None
+
+    async def load(self) -> None:
+        """
+        Асинхронно загружает конфиг, если он еще не был прочитан
+        """
+        if self._config_loader is None:
+            self._config_loader = await ConfigBotLoader.create(self._config_file)
 
     @property
     def data(self) -> ConfigBot:
         """
-        Данные конфига
+        Данные конфига (файл читается при первом обращении)
         """
+        if self._config_loader is None:
+            self._config_loader = ConfigBotLoader(self._config_file)
         return self._config_loader.get("config")
 
+
+@functools.cache
+def get_config() -> Config:
+    """
+    Возвращает общий экземпляр настроек бота
+    """
+    return Config()
@@ -6,21 +6,24 @@
 
 Для работы требуется установка aiosqlite: pip install aiosqlite
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import aiosqlite
-from typing import Optional, Any
+from typing import Optional, Any, Iterable
 
-from _singleton import Singleton
-from const import BD_CONFIG, PathLike
+from const import BD_CONFIG_STR, PathLike
+from core.database_manager.connection_pool import AioSqlitePool
 from logger import Logger
-from utils import load_config
+from utils import load_config, load_config_async
 
 logger = Logger().get_logger()
 
+# Каталоги БД, существование которых уже проверено
+_db_dir_ready: set[str] = set()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TableConfig:
     """
     Конфигурация таблицы
@@ -29,8 +32,10 @@ class TableConfig:
     table_name: str
     # Имя колонок таблицы
     columns: dict[str,str]
+    # Индексы таблицы: имя индекса -> {"columns": ["колонка [ASC|DESC]", ...], "unique": bool}
+    indexes: dict[str, dict[str, Any]] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DatabaseConfig:
     """
     Конфигурация БД
@@ -48,22 +53,38 @@ class ConfigDatabaseLoader(dict):
     """
     Загрузчик основных настроек БД
     """
-    def __init__(self, config_file: str = None) -> None:
+    def __init__(self, config_file: str = None, config_data: Optional[dict] = None) -> None:
+        """
+        Создает загрузчик настроек БД
+
+        :param config_file: Файл конфига в json формате
+        :param config_data: Уже прочитанные данные конфига (файл не читается повторно)
+        """
         super().__init__()
-        self.config = load_config(config_file or BD_CONFIG)
+        self.config = config_data if config_data is not None else load_config(config_file or BD_CONFIG_STR)
 
         db_config_data = self.config.get("db_config", {})
 
-        tables = []
-        for table_data in db_config_data.pop("tables"):
-            table_config = TableConfig(**table_data)
-            tables.append(table_config)
+        # Данные конфига кэшируются загрузчиком, поэтому словарь не изменяется
+        tables = [TableConfig(**table_data) for table_data in db_config_data.get("tables", [])]
 
         db_config = DatabaseConfig(
-            **db_config_data,
+            **{key: value for key, value in db_config_data.items() if key != "tables"},
             tables=tables
         )
         self["db_config"] = db_config
+        # Индекс таблиц по имени для быстрого поиска
+        self._by_name: dict[str, TableConfig] = {table.table_name: table for table in tables}
+
+    @classmethod
+    async def create(cls, config_file: str = None) -> "ConfigDatabaseLoader":
+        """
+        Создает загрузчик, читая конфиг без блокировки цикла событий
+
+        :param config_file: Файл конфига в json формате
+        """
+        config_data = await load_config_async(config_file or BD_CONFIG_STR)
+        return cls(config_file, config_data=config_data)
 
     def get_table_config(self, table_name: str) -> TableConfig | None:
         """
@@ -71,59 +92,201 @@ class ConfigDatabaseLoader(dict):
 
         :param table_name: Имя таблицы
         """
-        db_config = self["db_config"]
-        for table in db_config.tables:
-            if table.table_name == table_name:
-                return table
-        return None
+        return self._by_name.get(table_name)
 
 
-class BaseDatabaseHandler(metaclass=Singleton):
+class BaseDatabaseHandler:
     """
     Обработчик базы данных
     """
     _conf_data: DatabaseConfig
     _db_file: PathLike
+    _db_file_str: str
+    # Пулы соединений с БД, общие для всех обработчиков (ключ - путь к файлу БД)
+    _pools: dict[str, AioSqlitePool] = {}
+    # Размер пула соединений
+    POOL_SIZE = 4
 
-    def __init__(self) -> None:
+    def __init__(self, conf_data: Optional[DatabaseConfig] = None) -> None:
         """
         Конструктор обработчика базы данных
+
+        :param conf_data: Загруженная конфигурация БД (если не передана, читается из конфига)
         """
-        self._conf_data: DatabaseConfig = ConfigDatabaseLoader().get("db_config")
+        self._conf_data: DatabaseConfig = conf_data or ConfigDatabaseLoader().get("db_config")
         self._db_file = Path(self._conf_data.db_file)
-        self._db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._db_file_str = str(self._db_file)
+        db_dir = str(self._db_file.parent)
+        if db_dir not in _db_dir_ready:
+            self._db_file.parent.mkdir(parents=True, exist_ok=True)
+            _db_dir_ready.add(db_dir)
+
+    @property
+    def _pool(self) -> AioSqlitePool:
+        """
+        Пул соединений для файла БД обработчика
+        """
+        pool = self._pools.get(self._db_file_str)
+        if pool is None:
+            pool = self._pools[self._db_file_str] = AioSqlitePool(
+                db_file=self._db_file_str,
+                size=self.POOL_SIZE,
+                safe_mode=self._conf_data.safe_mode
+            )
+        return pool
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Закрывает все пулы соединений с БД
+        """
+        for pool in cls._pools.values():
+            await pool.close()
+        cls._pools.clear()
 
     async def _execute(
             self,
             query: str,
             params: tuple[Any, ...] = (),
             fetch: bool = False,
-    ) -> Optional[list[dict[str, Any]]]:
+            as_tuples: bool = False,
+    ) -> Optional[list[aiosqlite.Row] | list[tuple]]:
         """
         Универсальный метод выполнения запроса
 
         :param query: SQL-запрос для выполнения
         :param params: Параметры для запроса
         :param fetch: Если True, возвращает результат запроса
+        :param as_tuples: Если True, строки возвращаются кортежами (без row_factory).
+            Для запросов с явным списком колонок и позиционной распаковкой
 
-        :return Результат запроса (только если fetch=True)
+        :return Строки результата запроса (только если fetch=True). Поддерживают доступ по имени колонки,
+            если не задан as_tuples
         """
         try:
-            async with aiosqlite.connect(self._db_file) as conn:
-                conn.row_factory = aiosqlite.Row
-                async with conn.cursor() as cursor:
-                    await cursor.execute(query, params)
+            async with self._pool.acquire() as conn:
+                if fetch:
+                    # Выполнение и выборка за одно обращение к потоку aiosqlite
+                    if as_tuples:
+                        row_factory = conn.row_factory
+                        conn.row_factory = None
+                        try:
+                            rows = await conn.execute_fetchall(query, params)
+                        finally:
+                            conn.row_factory = row_factory
+                    else:
+                        rows = await conn.execute_fetchall(query, params)
+                    # Запросы изменения с RETURNING открывают транзакцию, которую нужно зафиксировать
+                    if conn.in_transaction:
+                        await conn.commit()
+                    return list(rows) or None
 
-                    if fetch:
-                        result = await cursor.fetchall()
-                        return [dict(row) for row in result] if result else None
+                await conn.execute(query, params)
+                await conn.commit()
+                return None
 
+        except aiosqlite.Error as e:
+            logger.error("Ошибка выполнения запроса: %s\nQuery: %s\nParams: %s", e, query, params)
+            return None
+        except Exception as e:
+            logger.error("Неожиданная ошибка при выполнении запроса: %s", e)
+            return None
+
+    async def _execute_rowcount(self, query: str, params: tuple[Any, ...] = ()) -> Optional[int]:
+        """
+        Выполняет запрос изменения данных и возвращает число затронутых строк.
+        Позволяет отличить отсутствующую запись без предварительного SELECT
+
+        :param query: SQL-запрос для выполнения
+        :param params: Параметры для запроса
+        :return: Количество измененных строк или None в случае ошибки
+        """
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.execute(query, params) as cursor:
+                    rowcount = cursor.rowcount
+                await conn.commit()
+                return rowcount
+
+        except aiosqlite.Error as e:
+            logger.error("Ошибка выполнения запроса: %s\nQuery: %s\nParams: %s", e, query, params)
+            return None
+        except Exception as e:
+            logger.error("Неожиданная ошибка при выполнении запроса: %s", e)
+            return None
+
+    async def _execute_returning(self, query: str, params: tuple[Any, ...] = ()) -> Optional[list[tuple]]:
+        """
+        Выполняет запрос изменения данных с RETURNING.
+        В отличие от _execute отличает ошибку запроса от пустого результата
+
+        :param query: SQL-запрос для выполнения
+        :param params: Параметры для запроса
+        :return: Возвращенные строки (кортежами, пустой список если строк нет) или None в случае ошибки
+        """
+        try:
+            async with self._pool.acquire() as conn:
+                row_factory = conn.row_factory
+                conn.row_factory = None
+                try:
+                    rows = await conn.execute_fetchall(query, params)
+                finally:
+                    conn.row_factory = row_factory
+                if conn.in_transaction:
                     await conn.commit()
-                    return None
+                return list(rows)
 
         except aiosqlite.Error as e:
-            logger.error(f"Ошибка выполнения запроса: {e}\nQuery: {query}\nParams: {params}")
+            logger.error("Ошибка выполнения запроса: %s\nQuery: %s\nParams: %s", e, query, params)
             return None
         except Exception as e:
-            logger.error(f"Неожиданная ошибка при выполнении запроса: {e}")
+            logger.error("Неожиданная ошибка при выполнении запроса: %s", e)
             return None
+
+    async def _execute_many(
+            self,
+            query: str,
+            seq_params: Iterable[tuple[Any, ...]],
+    ) -> bool:
+        """
+        Выполняет один запрос для набора параметров в одной транзакции.
+        Основной способ массовой записи: вместо _execute на каждую строку
+
+        :param query: SQL-запрос для выполнения
+        :param seq_params: Последовательность параметров запроса
+        :return: True если запрос выполнен и зафиксирован
+        """
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.executemany(query, seq_params)
+                await conn.commit()
+                return True
+
+        except aiosqlite.Error as e:
+            logger.error("Ошибка выполнения пакетного запроса: %s\nQuery: %s", e, query)
+            return False
+        except Exception as e:
+            logger.error("Неожиданная ошибка при выполнении пакетного запроса: %s", e)
+            return False
+
+    async def _execute_many_ddl(self, statements: list[str]) -> bool:
+        """
+        Выполняет набор DDL-запросов в одной транзакции на одном соединении
+
+        :param statements: Список DDL-запросов
+        :return: True если все запросы выполнены и зафиксированы
+        """
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute("BEGIN")
+                for statement in statements:
+                    await conn.execute(statement)
+                await conn.commit()
+                return True
+
+        except aiosqlite.Error as e:
+            logger.error("Ошибка выполнения DDL: %s\nQueries: %s", e, statements)
+            return False
+        except Exception as e:
+            logger.error("Неожиданная ошибка при выполнении DDL: %s", e)
+            return False
@@ -0,0 +1,100 @@
+"""
+Пул асинхронных соединений с SQLite через aiosqlite
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import aiosqlite
+
+from const import PathLike
+from logger import Logger
+
+logger = Logger().get_logger()
+
+
+class AioSqlitePool:
+    """
+    Ограниченный пул соединений с БД
+    """
+    _db_file: PathLike
+    _size: int
+    _safe_mode: bool
+    _queue: asyncio.Queue[aiosqlite.Connection]
+    _connections: list[aiosqlite.Connection]
+    # Размер кэша подготовленных выражений sqlite3 на соединение
+    CACHED_STATEMENTS = 256
+
+    def __init__(self, db_file: PathLike, size: int = 4, safe_mode: bool = False) -> None:
+        """
+        Создает пул соединений. Соединения открываются при первом acquire
+
+        :param db_file: Путь к файлу БД
+        :param size: Количество соединений в пуле
+        :param safe_mode: Если True, fsync выполняется на каждый коммит (synchronous=FULL)
+        """
+        self._db_file = db_file
+        self._size = size
+        self._safe_mode = safe_mode
+        self._queue = asyncio.Queue(maxsize=size)
+        self._connections = []
+        self._init_lock = asyncio.Lock()
+        self._initialized = False
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """
+        Открывает новое соединение и один раз настраивает его PRAGMA
+        """
+        conn = await aiosqlite.connect(self._db_file, cached_statements=self.CACHED_STATEMENTS)
+        conn.row_factory = aiosqlite.Row
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute(f"PRAGMA synchronous={'FULL' if self._safe_mode else 'NORMAL'}")
+        await conn.execute("PRAGMA temp_store=MEMORY")
+        await conn.execute("PRAGMA cache_size=-20000")
+        return conn
+
+    async def _fill(self) -> None:
+        """
+        Заполняет пул соединениями (один раз)
+        """
+        async with self._init_lock:
+            if self._initialized:
+                return
+            for _ in range(self._size):
+                conn = await self._connect()
+                self._connections.append(conn)
+                self._queue.put_nowait(conn)
+            self._initialized = True
+            logger.info("Открыт пул из %s соединений с БД %s", self._size, self._db_file)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Берет соединение из пула и возвращает его обратно после использования
+        """
+        if not self._initialized:
+            await self._fill()
+
+        conn = await self._queue.get()
+        try:
+            yield conn
+        finally:
+            # Незавершенная транзакция не должна достаться следующему потребителю
+            if conn.in_transaction:
+                await conn.rollback()
+            self._queue.put_nowait(conn)
+
+    async def close(self) -> None:
+        """
+        Закрывает все соединения пула
+        """
+        async with self._init_lock:
+            for conn in self._connections:
+                try:
+                    await conn.close()
+                except aiosqlite.Error as e:
+                    logger.error("Ошибка закрытия соединения с БД %s: %s", self._db_file, e)
+            self._connections.clear()
+            self._queue = asyncio.Queue(maxsize=self._size)
+            self._initialized = False
+            logger.info("Пул соединений с БД %s закрыт", self._db_file)
@@ -1,6 +1,8 @@
+from typing import Optional
+
 import aiosqlite
 
-from core.database_manager.base_database_handler import BaseDatabaseHandler, TableConfig
+from core.database_manager.base_database_handler import BaseDatabaseHandler, TableConfig, DatabaseConfig
 from logger import Logger
 
 
@@ -12,32 +14,82 @@ class CreatorDatabase(BaseDatabaseHandler):
     Инициализатор БД и таблиц
     """
 
-    def __init__(self) -> None:
+    def __init__(self, conf_data: Optional[DatabaseConfig] = None) -> None:
         """
         Создает экземпляр CreatorDatabase
+
+        :param conf_data: Загруженная конфигурация БД
+        """
+        super().__init__(conf_data)
+
+    async def __existing_tables(self) -> set[str]:
+        """
+        Получает имена всех существующих таблиц одним запросом
+
+        :return: Множество имен таблиц
+        """
+        result = await self._execute(
+            "SELECT name FROM sqlite_master WHERE type='table'",
+            fetch=True
+        )
+        return {row["name"] for row in (result or [])}
+
+    async def __existing_indexes(self) -> set[str]:
+        """
+        Получает имена всех существующих индексов одним запросом
+
+        :return: Множество имен индексов
         """
-        super().__init__()
+        result = await self._execute(
+            "SELECT name FROM sqlite_master WHERE type='index'",
+            fetch=True
+        )
+        return {row["name"] for row in (result or [])}
 
-    async def __table_exists(self, table_name: str) -> bool:
+    async def __has_duplicates(self, table_name: str, columns: list[str]) -> bool:
         """
-        Проверка существования таблицы
+        Проверяет, есть ли в таблице строки с одинаковыми значениями колонок
+        (уникальный индекс по ним создать нельзя)
 
         :param table_name: Имя таблицы
-        :return: True если таблица существует, False если нет или произошла ошибка
+        :param columns: Колонки индекса (могут содержать направление сортировки)
+        :return: True если дубликаты есть
         """
-        try:
-            result = await self._execute(
-                "SELECT count(*) FROM sqlite_master WHERE type='table' AND name=?",
-                (table_name,),
-                fetch=True
-            )
-            exists = bool(result and result[0]['count(*)'] > 0)
-            logger.debug(
-                f"Проверка существования таблицы {table_name}: {'существует' if exists else 'не существует'}")
-            return exists
-        except aiosqlite.Error as e:
-            logger.error(f"Ошибка проверки таблицы: {e}")
-            return False
+        columns_sql = ", ".join(f'"{col.split()[0]}"' for col in columns)
+        result = await self._execute(
+            f'SELECT 1 FROM "{table_name}" GROUP BY {columns_sql} HAVING COUNT(*) > 1 LIMIT 1',
+            fetch=True
+        )
+        return bool(result)
+
+    async def __unique_indexes_to_skip(self, existing_tables: set[str]) -> set[str]:
+        """
+        Находит новые уникальные индексы существующих таблиц, которые нельзя создать из-за дубликатов.
+        Такие индексы пропускаются, чтобы старая БД не мешала запуску бота
+
+        :param existing_tables: Имена существующих таблиц
+        :return: Имена пропускаемых индексов
+        """
+        existing_indexes = None
+        skip = set()
+        for table in self._conf_data.tables:
+            if table.table_name not in existing_tables:
+                continue
+            for index_name, index in table.indexes.items():
+                if not index.get("unique"):
+                    continue
+                if existing_indexes is None:
+                    existing_indexes = await self.__existing_indexes()
+                if index_name in existing_indexes:
+                    continue
+                if await self.__has_duplicates(table.table_name, index["columns"]):
+                    logger.error(
+                        "Уникальный индекс %s не создан: в таблице %s есть повторяющиеся значения %s. "
+                        "Удалите дубликаты, индекс будет создан при следующем запуске",
+                        index_name, table.table_name, index["columns"]
+                    )
+                    skip.add(index_name)
+        return skip
 
     async def __validate_existing_table(self, table_name: str, columns: dict[str, str]) -> bool:
         """
@@ -47,10 +99,6 @@ class CreatorDatabase(BaseDatabaseHandler):
         :param columns: Словарь колонок
         :return: True если структура соответствует конфигурации, False в противном случае
         """
-        if not await self.__table_exists(table_name):
-            logger.warning(f"Таблица {table_name} не существует для валидации")
-            return False
-
         try:
             result = await self._execute(
                 f"PRAGMA table_info({table_name})",
@@ -61,34 +109,49 @@ class CreatorDatabase(BaseDatabaseHandler):
             # Проверка всех колонок из конфига
             for col, typ in columns.items():
                 if col not in existing_columns:
-                    logger.warning(f"Колонка {col} отсутствует в таблице {table_name}")
+                    logger.warning("Колонка %s отсутствует в таблице %s", col, table_name)
                     return False
                 if existing_columns[col] != typ:
-                    logger.warning(f"Тип колонки {col} не совпадает: ожидалось {typ}, получено {existing_columns[col]}")
-            logger.debug(f"Таблица {table_name} прошла валидацию структуры")
+                    logger.warning("Тип колонки %s не совпадает: ожидалось %s, получено %s", col, typ, existing_columns[col])
+            logger.debug("Таблица %s прошла валидацию структуры", table_name)
             return True
         except aiosqlite.Error as e:
-            logger.error(f"Ошибка валидации таблицы {table_name}: {e}")
+            logger.error("Ошибка валидации таблицы %s: %s", table_name, e)
             return False
 
-    async def __create_table(self, table: TableConfig) -> bool:
+    @staticmethod
+    def __create_table_sql(table: TableConfig) -> str:
         """
-        Создание таблицы
+        Формирует запрос создания таблицы
 
         :param table: Таблица. Экземпляр TableConfig
         """
-        try:
+        columns_sql = ", ".join(
+            f'"{col}" {typ}' for col, typ in table.columns.items()
+        )
+        return f'CREATE TABLE "{table.table_name}" ({columns_sql})'
+
+    @staticmethod
+    def __create_indexes_sql(table: TableConfig, skip: set[str] = frozenset()) -> list[str]:
+        """
+        Формирует запросы создания индексов таблицы (если они еще не созданы)
+
+        :param table: Таблица. Экземпляр TableConfig
+        :param skip: Имена индексов, которые не создаются
+        """
+        statements = []
+        for index_name, index in table.indexes.items():
+            if index_name in skip:
+                continue
+            unique = "UNIQUE " if index.get("unique") else ""
+            # Колонка может содержать направление сортировки: "level DESC"
             columns_sql = ", ".join(
-                f'"{col}" {typ}' for col, typ in table.columns.items()
+                " ".join((f'"{name}"', *order)) for name, *order in (col.split() for col in index["columns"])
             )
-            await self._execute(
-                f'CREATE TABLE "{table.table_name}" ({columns_sql})'
+            statements.append(
+                f'CREATE {unique}INDEX IF NOT EXISTS "{index_name}" ON "{table.table_name}" ({columns_sql})'
             )
-            logger.info(f"Таблица {table.table_name} успешно создана")
-            return True
-        except Exception as e:
-            logger.error(f"Ошибка создания таблицы {table.table_name}: {e}")
-            return False
+        return statements
 
     async def init_db(self) -> bool:
         """
@@ -96,25 +159,43 @@ class CreatorDatabase(BaseDatabaseHandler):
 
         :return: Флаг успешной инициализации
         """
-        logger.info(f"Инициализация БД {self._db_file}")
+        logger.info("Инициализация БД %s", self._db_file)
 
         try:
+            existing_tables = await self.__existing_tables()
+            logger.debug("Существующие таблицы: %s", existing_tables)
+
+            missing_tables = []
             for table in self._conf_data.tables:
-                if await self.__table_exists(table.table_name):
+                if table.table_name in existing_tables:
                     if self._conf_data.safe_mode:
                         if not await self.__validate_existing_table(
                                 table_name=table.table_name,
                                 columns=table.columns
                         ):
-                            logger.error(f"Несоответствие структуры таблицы {table.table_name} конфигу")
+                            logger.error("Несоответствие структуры таблицы %s конфигу", table.table_name)
                             return False
                     continue
 
                 # Таблицы не существует - создаем
-                if not await self.__create_table(table):
-                    return False
+                missing_tables.append(table)
+
+            skip_indexes = await self.__unique_indexes_to_skip(existing_tables)
+            statements = [self.__create_table_sql(table) for table in missing_tables]
+            for table in self._conf_data.tables:
+                statements.extend(self.__create_indexes_sql(table, skip_indexes))
+
+            if not statements:
+                return True
+
+            # Все недостающие таблицы и индексы создаются в одной транзакции
+            if not await self._execute_many_ddl(statements):
+                logger.error("Ошибка создания таблиц %s или индексов", [table.table_name for table in missing_tables])
+                return False
 
+            for table in missing_tables:
+                logger.info("Таблица %s успешно создана", table.table_name)
             return True
         except Exception as e:
-            logger.error(f"Ошибка инициализации БД: {e}")
+            logger.error("Ошибка инициализации БД: %s", e)
             return False
@@ -1,21 +1,35 @@
+import functools
 from typing import Optional
 
-from core import Config
+from core import get_config
 from core.database_manager.base_database_handler import BaseDatabaseHandler
 from core.database_manager.const_bd import TableBD
 from errors import ErrorCode
 from logger import Logger
 
+logger = Logger().get_logger()
+
 
 class DatabaseBotSettingsHandler(BaseDatabaseHandler):
     """
     Обработчик таблицы с настройками бота
     """
     _table_name : str
+    _sql_upsert: str
+    _sql_get_token: str
 
     def __init__(self):
         super().__init__()
         self._table_name = TableBD.BOT_SETTINGS.value
+        # Имя таблицы неизменно, поэтому SQL формируется один раз
+        self._sql_upsert = f'''
+            INSERT INTO "{self._table_name}" (bot_id, token, description)
+            VALUES (?, ?, ?)
+            ON CONFLICT(bot_id) DO UPDATE SET
+                token = excluded.token,
+                description = excluded.description
+        '''
+        self._sql_get_token = f'SELECT token FROM "{self._table_name}" WHERE bot_id = ?'
 
     async def set_token(
             self,
@@ -30,56 +44,38 @@ class DatabaseBotSettingsHandler(BaseDatabaseHandler):
         :return: True если операция успешна, False в противном случае
         """
         # HACK пока берем токен из json(НУЖНО ПЕРЕДЕЛАТЬ)
-        Logger().get_logger().debug(f"Начало установки токена для бота {self._conf_data.id_bot}")
+        logger.debug("Начало установки токена для бота %s", self._conf_data.id_bot)
 
         try:
             # Получаем токен из конфига
             try:
-                token = Config().data.token
+                token = get_config().data.token
                 if not token:
-                    Logger().get_logger().error("Токен бота не найден в конфигурации")
+                    logger.error("Токен бота не найден в конфигурации")
                     return ErrorCode.TOKEN_ERROR
-                Logger().get_logger().debug("Токен успешно получен из конфигурации")
-            except Exception as e:
-                Logger().get_logger().error(f"Ошибка загрузки конфигурации: {str(e)}")
-                return ErrorCode.FAILED_ERROR
-
-            # Проверяем существование записи
-            try:
-                existing = await self._execute(
-                    f'SELECT 1 FROM "{self._table_name}" WHERE bot_id = ?',
-                    (self._conf_data.id_bot,),
-                    fetch=True
-                )
-                operation = "обновление" if existing else "создание"
-                Logger().get_logger().debug(f"Определена операция: {operation} токена")
+                logger.debug("Токен успешно получен из конфигурации")
             except Exception as e:
-                Logger().get_logger().error(f"Ошибка проверки существования записи: {str(e)}")
+                logger.error("Ошибка загрузки конфигурации: %s", e)
                 return ErrorCode.FAILED_ERROR
 
-            # Формируем запрос
-            if existing:
-                query = f'UPDATE "{self._table_name}" SET token = ?, description = ? WHERE bot_id = ?'
-                params = (token, description, self._conf_data.id_bot)
-            else:
-                query = f'INSERT INTO "{self._table_name}" (bot_id, token, description) VALUES (?, ?, ?)'
-                params = (self._conf_data.id_bot, token, description)
+            # Создаем или обновляем запись одним запросом
+            params = (self._conf_data.id_bot, token, description)
 
             # Выполняем запрос
             try:
-                result = await self._execute(query, params)
+                result = await self._execute(self._sql_upsert, params)
                 if result is None:
-                    Logger().get_logger().info(f"Успешное {operation} токена для бота {self._conf_data.id_bot}")
+                    logger.info("Успешная установка токена для бота %s", self._conf_data.id_bot)
                     return ErrorCode.SUCCESSFUL
                 else:
-                    Logger().get_logger().error(f"Ошибка при {operation} токена: {result}")
+                    logger.error("Ошибка при установке токена: %s", result)
                     return ErrorCode.FAILED_ERROR
             except Exception as e:
-                Logger().get_logger().error(f"Ошибка выполнения запроса {operation}: {str(e)}")
+                logger.error("Ошибка выполнения запроса установки токена: %s", e)
                 return ErrorCode.INIT_DB_ERROR
 
         except Exception as e:
-            Logger().get_logger().error(f"Неожиданная ошибка в set_token: {str(e)}")
+            logger.error("Неожиданная ошибка в set_token: %s", e)
             return ErrorCode.INIT_DB_ERROR
 
     async def get_token(self) -> Optional[str]:
@@ -90,19 +86,27 @@ class DatabaseBotSettingsHandler(BaseDatabaseHandler):
         """
         try:
             result = await self._execute(
-                f'SELECT token FROM "{self._table_name}" WHERE bot_id = ?',
+                self._sql_get_token,
                 (self._conf_data.id_bot,),
                 fetch=True
             )
 
             if not result:
-                Logger().get_logger().warning(f"Токен для бота {self._conf_data.id_bot} не найден")
+                logger.warning("Токен для бота %s не найден", self._conf_data.id_bot)
                 return None
 
             token = result[0]['token']
-            Logger().get_logger().debug(f"Успешно получен токен для бота {self._conf_data.id_bot}")
+            logger.debug("Успешно получен токен для бота %s", self._conf_data.id_bot)
             return token
 
         except Exception as e:
-            Logger().get_logger().error(f"Ошибка при получении токена: {str(e)}")
+            logger.error("Ошибка при получении токена: %s", e)
             return None
+
+
+@functools.cache
+def get_db_settings_handler() -> DatabaseBotSettingsHandler:
+    """
+    Возвращает общий экземпляр обработчика настроек бота
+    """
+    return DatabaseBotSettingsHandler()
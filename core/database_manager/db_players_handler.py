@@ -1,7 +1,14 @@
-from dataclasses import dataclass
+import asyncio
+import functools
+import itertools
+import os
+import re
+import secrets
+import shutil
+import stat
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
-import uuid
 
 from const import PHOTOS_DIR, PathLike, CONFIG_LEVEL_PLAYERS
 from core.database_manager.base_database_handler import BaseDatabaseHandler
@@ -12,6 +19,43 @@ from utils import load_config
 
 logger = Logger().get_logger()
 
+# Максимальный размер файла фото (10MB)
+MAX_PHOTO_SIZE = 10 * 1024 * 1024
+# Колонки игрока в порядке полей QuizPlayer (строка результата распаковывается в QuizPlayer(*row))
+_PLAYER_COLUMNS = "player_id, first_name, last_name, rank_player, nickname, photo, games_played, level"
+# Символы, недопустимые в имени файла фото (разрешены буквы, цифры, пробел, "-" и "_")
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]+")
+
+
+def _unlink_many(paths: list[str]) -> list[tuple[str, Optional[OSError]]]:
+    """
+    Удаляет пачку файлов за один переход в рабочий поток
+
+    :param paths: Пути к файлам
+    :return: Список пар (путь, ошибка или None). Отсутствующий файл ошибкой не считается
+    """
+    results = []
+    for path in paths:
+        try:
+            os.unlink(path)
+            results.append((path, None))
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            results.append((path, e))
+    return results
+
+
+def _write_new_file(path: PathLike, data: bytes) -> None:
+    """
+    Записывает данные в новый файл одним вызовом (файл не должен существовать)
+
+    :param path: Путь к файлу
+    :param data: Содержимое файла
+    """
+    with open(path, "xb") as file:
+        file.write(data)
+
 
 @dataclass
 class LevelConfig:
@@ -21,6 +65,15 @@ class LevelConfig:
     level_divider: int
     rank_divider: int
     ranks: dict[str, str]
+    # Ранги, упорядоченные по tier (индекс кортежа - tier)
+    ranks_by_tier: tuple[Optional[str], ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """
+        Строит кортеж рангов по tier, чтобы не искать ранг по строковому ключу
+        """
+        tiers = {int(tier): rank for tier, rank in self.ranks.items()}
+        self.ranks_by_tier = tuple(tiers.get(tier) for tier in range(max(tiers, default=-1) + 1))
 
     @classmethod
     def from_dict(cls, config_data: PathLike = CONFIG_LEVEL_PLAYERS) -> 'LevelConfig':
@@ -41,19 +94,19 @@ class LevelConfig:
             ranks=ranks
         )
 
-    def get_rank_by_tier(self, tier: int) -> str:
+    def get_rank_by_tier(self, tier: int) -> Optional[str]:
         """
         Получает название ранга по tier
 
         :param tier: Числовой tier
         :return: Название ранга
         """
-        tier_str = str(tier)
-
-        return self.ranks.get(tier_str)
+        if 0 <= tier < len(self.ranks_by_tier):
+            return self.ranks_by_tier[tier]
+        return None
 
 
-@dataclass
+@dataclass(slots=True)
 class QuizPlayer:
     """
     Данные игрока квиза
@@ -72,6 +125,8 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
     """
     Обработчик для работы с игроками квиза
     """
+    # Обработчики с запущенным удалением фото, которые нужно остановить при завершении приложения
+    _photo_deleters: set["DatabaseQuizPlayerHandler"] = set()
 
     def __init__(self) -> None:
         """
@@ -80,8 +135,27 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
         super().__init__()
         self._table_name = TableBD.QUIZ_PLAYERS.value
         self.config_level = LevelConfig.from_dict()
+        # Запросы собираются один раз: одинаковый текст SQL переиспользует подготовленные выражения
+        # Проверка существования игрока в самом запросе не зависит от уникального индекса по имени и фамилии
+        # (в старой БД с дубликатами он не создается)
+        self._sql_insert = (
+            f"INSERT INTO {self._table_name} "
+            f"(first_name, last_name, nickname, photo, games_played, rank_player, level) "
+            f"SELECT ?, ?, ?, ?, ?, ?, ? "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {self._table_name} WHERE first_name = ? AND last_name = ?) "
+            f"RETURNING player_id"
+        )
+        self._sql_delete = f"DELETE FROM {self._table_name} WHERE player_id = ? RETURNING photo"
+        self._sql_get_by_id = f"SELECT {_PLAYER_COLUMNS} FROM {self._table_name} WHERE player_id = ?"
+        self._sql_get_all = (
+            f"SELECT {_PLAYER_COLUMNS} FROM {self._table_name} ORDER BY level DESC, last_name, first_name"
+        )
+        self._sql_increment_games, self._increment_games_params = self._build_increment_games_sql()
         PHOTOS_DIR.mkdir(parents=True, exist_ok=True)
-        self.allowed_extensions = {'.jpg', '.jpeg', '.png'}
+        # Очередь файлов фото на удаление и фоновый обработчик очереди (запускается при первом удалении)
+        self._delete_queue: asyncio.Queue[str] = asyncio.Queue()
+        self._photo_deleter_task: Optional[asyncio.Task] = None
+        self.allowed_extensions = frozenset({'.jpg', '.jpeg', '.png'})
 
     async def add_player(
             self,
@@ -91,7 +165,8 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
             photo_path: Optional[str] = None,
             games_played: int = 0,
             rank_player: Optional[str] = None,
-            level: Optional[int] = None
+            level: Optional[int] = None,
+            photo_bytes: Optional[bytes] = None
     ) -> ErrorCode:
         """
         Добавление нового игрока квиза
@@ -103,51 +178,55 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
         :param games_played: Количество сыгранных игр
         :param rank_player: Ранг игрока игрока
         :param level: Цифровой уровень игрока (1-100)
+        :param photo_bytes: Содержимое фото в формате JPEG (опционально, вместо photo_path)
 
         :return: Код результата операции
         """
         try:
             if level is None:
-                level = await self.calculate_level_from_games(games_played)
+                level = self.calculate_level_from_games(games_played)
 
             if rank_player is None:
-                rank_player = await self.calculate_rank_player_from_games(games_played)
+                rank_player = self.calculate_rank_player_from_games(games_played)
 
             if level < 0:
-                logger.warning(f"Некорректный цифровой уровень: {level}")
+                logger.warning("Некорректный цифровой уровень: %s", level)
                 return ErrorCode.INVALID_INPUT
 
-            existing_player = await self._execute(
-                f"SELECT player_id FROM {self._table_name} WHERE first_name = ? AND last_name = ?",
-                (first_name, last_name),
-                fetch=True
-            )
-            if existing_player:
-                logger.warning(f"Игрок {first_name} {last_name} уже существует")
-                return ErrorCode.USER_ALREADY_EXISTS
-
             # Обрабатываем фото если оно есть
             final_photo_path = None
-            if photo_path:
+            if photo_bytes:
+                final_photo_path = await self._save_photo_bytes(photo_bytes, first_name, last_name)
+                if not final_photo_path:
+                    logger.warning("Не удалось сохранить фото для игрока %s %s", first_name, last_name)
+            elif photo_path:
                 final_photo_path = await self._process_photo(photo_path, first_name, last_name)
                 if not final_photo_path:
-                    logger.warning(f"Не удалось обработать фото для игрока {first_name} {last_name}")
+                    logger.warning("Не удалось обработать фото для игрока %s %s", first_name, last_name)
 
-            # Добавляем нового игрока
-            await self._execute(
-                f"""
-                INSERT INTO {self._table_name} 
-                (first_name, last_name, nickname, photo, games_played, rank_player, level)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (first_name, last_name, nickname, final_photo_path, games_played, rank_player, level)
+            # Добавляем нового игрока. Существующий игрок не изменяется, и запрос ничего не возвращает
+            result = await self._execute_returning(
+                self._sql_insert,
+                (first_name, last_name, nickname, final_photo_path, games_played, rank_player, level,
+                 first_name, last_name)
             )
+            if result is None:
+                logger.error("Ошибка БД при добавлении игрока %s %s", first_name, last_name)
+                if final_photo_path:
+                    await self._delete_photo_file(final_photo_path)
+                return ErrorCode.DATABASE_ERROR
 
-            logger.info(f"Игрок {first_name} {last_name} успешно добавлен")
+            if not result:
+                logger.warning("Игрок %s %s уже существует", first_name, last_name)
+                if final_photo_path:
+                    await self._delete_photo_file(final_photo_path)
+                return ErrorCode.USER_ALREADY_EXISTS
+
+            logger.info("Игрок %s %s успешно добавлен", first_name, last_name)
             return ErrorCode.SUCCESSFUL
 
         except Exception as e:
-            logger.error(f"Ошибка при добавлении игрока: {e}")
+            logger.error("Ошибка при добавлении игрока: %s", e)
             return ErrorCode.DATABASE_ERROR
 
     async def _process_photo(self, photo_path: str, first_name: str, last_name: str) -> Optional[str]:
@@ -160,36 +239,75 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
         :return: Путь к сохраненному файлу или None в случае ошибки
         """
         try:
-            source_path = Path(photo_path)
-
-            # Проверяем существование файла
-            if not source_path.exists():
-                logger.error(f"Файл фото не найден: {photo_path}")
+            # Проверяем существование файла (один вызов stat)
+            try:
+                st = os.stat(photo_path)
+            except FileNotFoundError:
+                st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
+                logger.error("Файл фото не найден: %s", photo_path)
                 return None
 
             # Проверяем расширение файла
-            if source_path.suffix.lower() not in self.allowed_extensions:
-                logger.error(f"Неподдерживаемый формат фото: {source_path.suffix}")
+            suffix = os.path.splitext(photo_path)[1].lower()
+            if suffix not in self.allowed_extensions:
+                logger.error("Неподдерживаемый формат фото: %s", suffix)
                 return None
 
-            # Генерируем уникальное имя файла
-            safe_first_name = "".join(c for c in first_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_last_name = "".join(c for c in last_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            unique_id = uuid.uuid4().hex[:8]
-            new_filename = f"{safe_first_name}_{safe_last_name}_{unique_id}{source_path.suffix.lower()}"
-            new_filepath = PHOTOS_DIR / new_filename
+            # Копируем файл под уникальным именем
+            new_filepath = self._new_photo_filepath(first_name, last_name, suffix)
+            # shutil.copy2 сам использует sendfile там, где он доступен
+            await asyncio.to_thread(shutil.copy2, photo_path, new_filepath)
+
+            logger.info("Фото сохранено: %s", new_filepath)
+            return str(new_filepath)
+
+        except Exception as e:
+            logger.error("Ошибка при обработке фото: %s", e)
+            return None
+
+    async def _save_photo_bytes(
+            self, photo_bytes: bytes, first_name: str, last_name: str, suffix: str = ".jpg"
+    ) -> Optional[str]:
+        """
+        Сохраняет содержимое фото сразу в каталог фото игроков, без промежуточного файла
+
+        :param photo_bytes: Содержимое фото
+        :param first_name: Имя игрока
+        :param last_name: Фамилия игрока
+        :param suffix: Расширение файла
+        :return: Путь к сохраненному файлу или None в случае ошибки
+        """
+        try:
+            if len(photo_bytes) > MAX_PHOTO_SIZE:
+                logger.error("Фото слишком большое: %s байт", len(photo_bytes))
+                return None
 
-            # Копируем файл
-            import shutil
-            shutil.copy2(source_path, new_filepath)
+            new_filepath = self._new_photo_filepath(first_name, last_name, suffix)
+            await asyncio.to_thread(_write_new_file, new_filepath, photo_bytes)
 
-            logger.info(f"Фото сохранено: {new_filepath}")
+            logger.info("Фото сохранено: %s", new_filepath)
             return str(new_filepath)
 
         except Exception as e:
-            logger.error(f"Ошибка при обработке фото: {e}")
+            logger.error("Ошибка при сохранении фото: %s", e)
             return None
 
+    @staticmethod
+    def _new_photo_filepath(first_name: str, last_name: str, suffix: str) -> Path:
+        """
+        Генерирует уникальный путь к файлу фото игрока
+
+        :param first_name: Имя игрока
+        :param last_name: Фамилия игрока
+        :param suffix: Расширение файла
+        :return: Путь к файлу в каталоге фото
+        """
+        safe_first_name = _UNSAFE_FILENAME_CHARS.sub("", first_name).rstrip()
+        safe_last_name = _UNSAFE_FILENAME_CHARS.sub("", last_name).rstrip()
+        unique_id = secrets.token_hex(4)
+        return PHOTOS_DIR / f"{safe_first_name}_{safe_last_name}_{unique_id}{suffix}"
+
     async def update_player_photo(self, player_id: int, photo_path: str) -> ErrorCode:
         """
         Обновляет фото игрока
@@ -203,39 +321,84 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
             if not player:
                 return ErrorCode.USER_NOT_FOUND
 
-            # Удаляем старое фото если оно есть
-            if player.photo:
-                await self._delete_photo_file(player.photo)
-
             # Обрабатываем новое фото
             new_photo_path = await self._process_photo(photo_path, player.first_name, player.last_name)
             if not new_photo_path:
                 return ErrorCode.INVALID_INPUT
 
             # Обновляем путь к фото в БД
-            return await self.update_player(player_id, photo=new_photo_path)
+            result = await self.update_player(player_id, photo=new_photo_path)
+
+            # Старое фото удаляем в фоне только после успешной замены
+            if result == ErrorCode.SUCCESSFUL and player.photo:
+                await self._delete_photo_file(player.photo)
+
+            return result
 
         except Exception as e:
-            logger.error(f"Ошибка при обновлении фото игрока {player_id}: {e}")
+            logger.error("Ошибка при обновлении фото игрока %s: %s", player_id, e)
             return ErrorCode.DATABASE_ERROR
 
-    async def _delete_photo_file(self, photo_path: str) -> bool:
+    async def _delete_photo_file(self, photo_path: str) -> None:
         """
-        Удаляет файл фото
+        Ставит файл фото в очередь на удаление, не задерживая ответ
 
         :param photo_path: Путь к файлу фото
-        :return: True если удалено успешно, False в случае ошибки
         """
-        try:
-            photo_file = Path(photo_path)
-            if photo_file.exists():
-                photo_file.unlink()
-                logger.info(f"Фото удалено: {photo_path}")
-                return True
-            return False
-        except Exception as e:
-            logger.error(f"Ошибка при удалении фото {photo_path}: {e}")
-            return False
+        if self._photo_deleter_task is None or self._photo_deleter_task.done():
+            self._photo_deleter_task = asyncio.create_task(self._photo_deleter())
+            self._photo_deleters.add(self)
+        await self._delete_queue.put(photo_path)
+
+    async def _photo_deleter(self) -> None:
+        """
+        Фоновый обработчик очереди: удаляет накопившиеся файлы фото пачками вне цикла событий
+        """
+        while True:
+            # Ждем первый файл и забираем все накопившиеся, чтобы удалить их одной пачкой
+            photo_paths = [await self._delete_queue.get()]
+            while not self._delete_queue.empty():
+                photo_paths.append(self._delete_queue.get_nowait())
+            try:
+                for photo_path, error in await asyncio.to_thread(_unlink_many, photo_paths):
+                    if error is None:
+                        logger.info("Фото удалено: %s", photo_path)
+                    else:
+                        logger.error("Ошибка при удалении фото %s: %s", photo_path, error)
+            except Exception as e:
+                logger.error("Ошибка при удалении фото %s: %s", photo_paths, e)
+            finally:
+                for _ in photo_paths:
+                    self._delete_queue.task_done()
+
+    async def stop_photo_deleter(self) -> None:
+        """
+        Дожидается удаления всех файлов фото из очереди и останавливает фоновый обработчик.
+        Вызывается при остановке приложения
+        """
+        task = self._photo_deleter_task
+        if task is None:
+            return
+
+        if not task.done():
+            await self._delete_queue.join()
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._photo_deleter_task = None
+        self._photo_deleters.discard(self)
+        logger.info("Очередь удаления фото обработана")
+
+    @classmethod
+    async def stop_photo_deleters(cls) -> None:
+        """
+        Останавливает удаление фото во всех обработчиках, где оно было запущено.
+        Вызывается при остановке приложения
+        """
+        for handler in list(cls._photo_deleters):
+            await handler.stop_photo_deleter()
 
     async def delete_player(self, player_id: int) -> ErrorCode:
         """
@@ -245,21 +408,20 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
         :return: Код результата операции
         """
         try:
-            # Получаем данные игрока для удаления фото
-            player = await self.get_player(player_id)
-            if player and player.photo:
-                await self._delete_photo_file(player.photo)
-
-            await self._execute(
-                f"DELETE FROM {self._table_name} WHERE player_id = ?",
-                (player_id,)
+            # Удаление и получение пути к фото одним запросом
+            result = await self._execute(
+                self._sql_delete,
+                (player_id,),
+                fetch=True
             )
+            if result and result[0]["photo"]:
+                await self._delete_photo_file(result[0]["photo"])
 
-            logger.info(f"Игрок {player_id} успешно удален")
+            logger.info("Игрок %s успешно удален", player_id)
             return ErrorCode.SUCCESSFUL
 
         except Exception as e:
-            logger.error(f"Ошибка при удалении игрока {player_id}: {e}")
+            logger.error("Ошибка при удалении игрока %s: %s", player_id, e)
             return ErrorCode.DATABASE_ERROR
 
     async def get_player_photo(self, player_id: int) -> Optional[str]:
@@ -273,7 +435,7 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
             player = await self.get_player(player_id)
             return player.photo if player else None
         except Exception as e:
-            logger.error(f"Ошибка при получении фото игрока {player_id}: {e}")
+            logger.error("Ошибка при получении фото игрока %s: %s", player_id, e)
             return None
 
     async def validate_photo_file(self, file_path: str) -> bool:
@@ -284,28 +446,32 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
         :return: True если файл валиден, False в противном случае
         """
         try:
-            path = Path(file_path)
+            # Один вызов stat на все проверки файла
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
+                st = None
 
             # Проверяем существование
-            if not path.exists():
-                logger.error(f"Файл не существует: {file_path}")
+            if st is None or not stat.S_ISREG(st.st_mode):
+                logger.error("Файл не существует: %s", file_path)
                 return False
 
             # Проверяем расширение
-            if path.suffix.lower() not in self.allowed_extensions:
-                logger.error(f"Неподдерживаемый формат: {path.suffix}")
+            suffix = os.path.splitext(file_path)[1].lower()
+            if suffix not in self.allowed_extensions:
+                logger.error("Неподдерживаемый формат: %s", suffix)
                 return False
 
-            # Проверяем размер файла (максимум 10MB)
-            max_size = 10 * 1024 * 1024  # 10MB
-            if path.stat().st_size > max_size:
-                logger.error(f"Файл слишком большой: {path.stat().st_size} байт")
+            # Проверяем размер файла
+            if st.st_size > MAX_PHOTO_SIZE:
+                logger.error("Файл слишком большой: %s байт", st.st_size)
                 return False
 
             return True
 
         except Exception as e:
-            logger.error(f"Ошибка при проверке файла {file_path}: {e}")
+            logger.error("Ошибка при проверке файла %s: %s", file_path, e)
             return False
 
     async def get_player(self, player_id: int) -> Optional[QuizPlayer]:
@@ -317,28 +483,19 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
         """
         try:
             result = await self._execute(
-                f"SELECT * FROM {self._table_name} WHERE player_id = ?",
+                self._sql_get_by_id,
                 (player_id,),
-                fetch=True
+                fetch=True,
+                as_tuples=True
             )
 
             if not result:
                 return None
 
-            player_data = result[0]
-            return QuizPlayer(
-                player_id=player_data.get("player_id"),
-                first_name=player_data.get("first_name"),
-                last_name=player_data.get("last_name"),
-                nickname=player_data.get("nickname"),
-                photo=player_data.get("photo"),
-                games_played=player_data.get("games_played"),
-                rank_player=player_data.get("rank_player"),
-                level=player_data.get("level")
-            )
+            return QuizPlayer(*result[0])
 
         except Exception as e:
-            logger.error(f"Ошибка при получении игрока {player_id}: {e}")
+            logger.error("Ошибка при получении игрока %s: %s", player_id, e)
             return None
 
     async def get_all_players(self) -> list[QuizPlayer]:
@@ -349,27 +506,15 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
         """
         try:
             result = await self._execute(
-                f"SELECT * FROM {self._table_name} ORDER BY level DESC, last_name, first_name",
-                fetch=True
+                self._sql_get_all,
+                fetch=True,
+                as_tuples=True
             )
 
-            players = []
-            for player_data in result:
-                players.append(QuizPlayer(
-                    player_id=player_data.get("player_id"),
-                    first_name=player_data.get("first_name"),
-                    last_name=player_data.get("last_name"),
-                    nickname=player_data.get("nickname"),
-                    photo=player_data.get("photo"),
-                    games_played=player_data.get("games_played"),
-                    rank_player=player_data.get("rank_player"),
-                    level=player_data.get("level")
-                ))
-
-            return players
+            return [QuizPlayer(*player_data) for player_data in result or ()]
 
         except Exception as e:
-            logger.error(f"Ошибка при получении списка игроков: {e}")
+            logger.error("Ошибка при получении списка игроков: %s", e)
             return []
 
     async def update_player(
@@ -399,7 +544,7 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
         """
         try:
             if level is not None and level < 0:
-                logger.warning(f"Некорректный цифровой уровень: {level}")
+                logger.warning("Некорректный цифровой уровень: %s", level)
                 return ErrorCode.INVALID_INPUT
 
             update_fields = []
@@ -432,16 +577,21 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
 
             params.append(player_id)
 
-            await self._execute(
+            rowcount = await self._execute_rowcount(
                 f"UPDATE {self._table_name} SET {', '.join(update_fields)} WHERE player_id = ?",
                 tuple(params)
             )
+            if rowcount is None:
+                return ErrorCode.DATABASE_ERROR
+            if rowcount == 0:
+                logger.warning("Игрок %s не найден", player_id)
+                return ErrorCode.USER_NOT_FOUND
 
-            logger.info(f"Данные игрока {player_id} успешно обновлены")
+            logger.info("Данные игрока %s успешно обновлены", player_id)
             return ErrorCode.SUCCESSFUL
 
         except Exception as e:
-            logger.error(f"Ошибка при обновлении игрока {player_id}: {e}")
+            logger.error("Ошибка при обновлении игрока %s: %s", player_id, e)
             return ErrorCode.DATABASE_ERROR
 
     async def update_level(self, player_id: int, level: int) -> ErrorCode:
@@ -464,7 +614,7 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
         """
         return await self.update_player(player_id, rank_player=rank_player)
 
-    async def calculate_level_from_games(self, games_played: int) -> int:
+    def calculate_level_from_games(self, games_played: int) -> int:
         """
         Рассчитывает цифровой уровень на основе количества сыгранных игр
 
@@ -473,7 +623,7 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
         """
         return games_played // self.config_level.level_divider
 
-    async def calculate_rank_player_from_games(self, games_played: int) -> str:
+    def calculate_rank_player_from_games(self, games_played: int) -> str:
         """
         Рассчитывает текстовый уровень на основе количества сыгранных игр
 
@@ -488,6 +638,31 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
 
         return self.config_level.get_rank_by_tier(level_tier)
 
+    def _build_increment_games_sql(self) -> tuple[str, tuple]:
+        """
+        Собирает запрос увеличения счетчика игр с расчетом уровня и ранга на стороне SQLite
+        (та же формула, что в calculate_level_from_games и calculate_rank_player_from_games)
+
+        :return: Кортеж (SQL-запрос, параметры запроса без ID игрока)
+        """
+        config = self.config_level
+
+        if config.rank_divider <= 0 or not config.ranks:
+            rank_sql = "?"
+            rank_params = (config.get_rank_by_tier(0),)
+        else:
+            ranks = [(tier, rank) for tier, rank in enumerate(config.ranks_by_tier) if rank is not None]
+            whens = " ".join("WHEN ? THEN ?" for _ in ranks)
+            rank_sql = f"CASE (games_played + 1) / ? {whens} ELSE NULL END"
+            rank_params = (config.rank_divider, *itertools.chain.from_iterable(ranks))
+
+        query = (
+            f"UPDATE {self._table_name} SET games_played = games_played + 1, "
+            f"level = (games_played + 1) / ?, rank_player = {rank_sql} "
+            f"WHERE player_id = ?"
+        )
+        return query, (config.level_divider, *rank_params)
+
     async def auto_update_levels(self, player_id: int) -> ErrorCode:
         """
         Автоматическое обновление уровней игрока на основе статистики
@@ -500,8 +675,8 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
             if not player:
                 return ErrorCode.USER_NOT_FOUND
 
-            new_level = await self.calculate_level_from_games(player.games_played)
-            new_rank_player = await self.calculate_rank_player_from_games(player.games_played)
+            new_level = self.calculate_level_from_games(player.games_played)
+            new_rank_player = self.calculate_rank_player_from_games(player.games_played)
 
             # Обновляем уровни
             return await self.update_player(
@@ -511,7 +686,7 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
             )
 
         except Exception as e:
-            logger.error(f"Ошибка при автоматическом обновлении уровней игрока {player_id}: {e}")
+            logger.error("Ошибка при автоматическом обновлении уровней игрока %s: %s", player_id, e)
             return ErrorCode.DATABASE_ERROR
 
     async def increment_games_played(self, player_id: int) -> ErrorCode:
@@ -522,16 +697,15 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
         :return: Код результата операции
         """
         try:
+            # Счетчик, уровень и ранг пересчитываются одним запросом
             await self._execute(
-                f"UPDATE {self._table_name} SET games_played = games_played + 1 WHERE player_id = ?",
-                (player_id,)
+                self._sql_increment_games,
+                (*self._increment_games_params, player_id)
             )
 
-            await self.auto_update_levels(player_id)
-
             return ErrorCode.SUCCESSFUL
         except Exception as e:
-            logger.error(f"Ошибка при увеличении счетчика игр для {player_id}: {e}")
+            logger.error("Ошибка при увеличении счетчика игр для %s: %s", player_id, e)
             return ErrorCode.DATABASE_ERROR
 
     async def update_all_players_levels(self) -> tuple[int, int]:
@@ -550,8 +724,8 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
             for player in players:
                 try:
                     # Пересчитываем уровни на основе текущего количества игр
-                    new_level = await self.calculate_level_from_games(player.games_played)
-                    new_rank_player = await self.calculate_rank_player_from_games(player.games_played)
+                    new_level = self.calculate_level_from_games(player.games_played)
+                    new_rank_player = self.calculate_rank_player_from_games(player.games_played)
 
                     # Обновляем только если уровни изменились
                     if new_level != player.level or new_rank_player != player.rank_player:
@@ -564,24 +738,30 @@ class DatabaseQuizPlayerHandler(BaseDatabaseHandler):
                         if result == ErrorCode.SUCCESSFUL:
                             updated_count += 1
                             logger.info(
-                                f"Обновлены уровни игрока {player.first_name} {player.last_name}: "
-                                f"уровень {player.level}→{new_level}, "
-                                f"ранг {player.rank_player}→{new_rank_player}"
+                                "Обновлены уровни игрока %s %s: уровень %s→%s, ранг %s→%s",
+                                player.first_name, player.last_name, player.level, new_level,
+                                player.rank_player, new_rank_player
                             )
                         else:
                             error_count += 1
-                            logger.error(
-                                f"Ошибка обновления уровней игрока {player.player_id}: {result}"
-                            )
+                            logger.error("Ошибка обновления уровней игрока %s: %s", player.player_id, result)
 
                 except Exception as e:
                     error_count += 1
-                    logger.error(f"Ошибка при обновлении игрока {player.player_id}: {str(e)}")
+                    logger.error("Ошибка при обновлении игрока %s: %s", player.player_id, e)
                     continue
 
-            logger.info(f"Массовое обновление уровней завершено: обновлено {updated_count}, ошибок {error_count}")
+            logger.info("Массовое обновление уровней завершено: обновлено %s, ошибок %s", updated_count, error_count)
             return updated_count, error_count
 
         except Exception as e:
-            logger.error(f"Критическая ошибка при массовом обновлении уровней: {str(e)}")
+            logger.error("Критическая ошибка при массовом обновлении уровней: %s", e)
             return 0, len(players)
+
+
+@functools.cache
+def get_players_handler() -> DatabaseQuizPlayerHandler:
+    """
+    Возвращает общий экземпляр обработчика игроков квиза
+    """
+    return DatabaseQuizPlayerHandler()
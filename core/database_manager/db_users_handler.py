@@ -1,5 +1,8 @@
+import asyncio
+import functools
+import time
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
 
 from aiogram import Bot
 
@@ -9,6 +12,9 @@ from errors import ErrorCode
 from logger import Logger
 
 
+logger = Logger().get_logger()
+
+
 class UserRole(Enum):
     """
     Роли пользователей
@@ -17,10 +23,30 @@ class UserRole(Enum):
     USER = "user"
 
 
+# Значения ролей для записи в БД (без обращения к Enum.value на каждый запрос)
+_ROLE_VALUES: dict[UserRole, str] = {role: role.value for role in UserRole}
+
+
+@functools.lru_cache(maxsize=None)
+def _role_from_str(role_str: Optional[str]) -> UserRole:
+    """
+    Преобразует значение роли из БД в UserRole (пустое значение - обычный пользователь)
+
+    :param role_str: Значение роли из БД
+    """
+    return UserRole(role_str) if role_str else UserRole.USER
+
+
 class DatabaseUserHandler(BaseDatabaseHandler):
     """
     Обработчик таблицы пользователей
     """
+    # Максимальное число одновременных запросов к Telegram при инициализации администраторов
+    ADMIN_INIT_CONCURRENCY = 20
+    # Время жизни закэшированной роли пользователя (секунды)
+    ROLE_CACHE_TTL = 60.0
+    # Максимальное число пользователей в кэше ролей (включая отсутствующих в БД)
+    ROLE_CACHE_MAXSIZE = 1024
 
     def __init__(self) -> None:
         """
@@ -28,6 +54,39 @@ class DatabaseUserHandler(BaseDatabaseHandler):
         """
         super().__init__()
         self._table_name = TableBD.USERS.value
+        # Кэш ролей: user_id -> (роль или None для отсутствующего пользователя, момент истечения)
+        self._role_cache: dict[int, tuple[Optional[UserRole], float]] = {}
+        # Подписчики на изменение данных пользователя (например, кэши middleware)
+        self._change_listeners: list[Callable[[int], None]] = []
+        # Вставка или обновление пользователя (незаданные поля не перезаписывают сохраненные значения)
+        self._sql_upsert_user = f'''
+            INSERT INTO "{self._table_name}" 
+            (user_id, username, first_name, last_name, role) 
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(user_id) DO UPDATE SET
+                username = COALESCE(excluded.username, username),
+                first_name = COALESCE(excluded.first_name, first_name),
+                last_name = COALESCE(excluded.last_name, last_name),
+                role = excluded.role
+        '''
+
+    def add_change_listener(self, listener: Callable[[int], None]) -> None:
+        """
+        Подписывает обработчик на изменение данных пользователя (добавление, обновление, удаление)
+
+        :param listener: Функция, принимающая ID измененного пользователя
+        """
+        self._change_listeners.append(listener)
+
+    def _user_changed(self, user_id: int) -> None:
+        """
+        Сбрасывает закэшированные данные пользователя и оповещает подписчиков
+
+        :param user_id: ID пользователя
+        """
+        self._role_cache.pop(user_id, None)
+        for listener in self._change_listeners:
+            listener(user_id)
 
     async def user_exists(self, user_id: int) -> bool:
         """
@@ -43,7 +102,7 @@ class DatabaseUserHandler(BaseDatabaseHandler):
             )
             return bool(result)
         except Exception as e:
-            Logger().get_logger().error(f"Ошибка проверки пользователя: {str(e)}")
+            logger.error("Ошибка проверки пользователя: %s", e)
             return False
 
     async def get_user_role(self, user_id: int) -> Optional[UserRole]:
@@ -52,6 +111,10 @@ class DatabaseUserHandler(BaseDatabaseHandler):
 
         :param user_id: ID пользователя
         """
+        cached = self._role_cache.get(user_id)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
         try:
             result = await self._execute(
                 f'SELECT role FROM "{self._table_name}" WHERE user_id = ?',
@@ -59,16 +122,28 @@ class DatabaseUserHandler(BaseDatabaseHandler):
                 fetch=True
             )
 
-            if not result:
-                return None
-
-            role_str = result[0]['role']
-            return UserRole(role_str) if role_str else UserRole.USER
+            # Отсутствие пользователя тоже кэшируется, ошибка запроса - нет
+            role = _role_from_str(result[0]['role']) if result else None
+            if len(self._role_cache) >= self.ROLE_CACHE_MAXSIZE:
+                # Вытесняем самую старую запись
+                self._role_cache.pop(next(iter(self._role_cache)))
+            self._role_cache[user_id] = (role, time.monotonic() + self.ROLE_CACHE_TTL)
+            return role
 
         except Exception as e:
-            Logger().get_logger().error(f"Ошибка получения роли пользователя: {str(e)}")
+            logger.error("Ошибка получения роли пользователя: %s", e)
             return None
 
+    async def get_user_auth(self, user_id: int) -> tuple[bool, Optional[UserRole]]:
+        """
+        Проверяет существование пользователя и получает его роль одним запросом
+
+        :param user_id: ID пользователя
+        :return: Кортеж (есть в БД, роль). Для отсутствующего пользователя роль None
+        """
+        role = await self.get_user_role(user_id)
+        return role is not None, role
+
     async def add_user(
             self,
             user_id: int,
@@ -87,28 +162,21 @@ class DatabaseUserHandler(BaseDatabaseHandler):
         :param role: Роль пользователя
         """
         try:
-            if await self.user_exists(user_id):
-                return await self.update_user(user_id, username, first_name, last_name, role)
-
-            query = f'''
-                   INSERT INTO "{self._table_name}" 
-                   (user_id, username, first_name, last_name, role) 
-                   VALUES (?, ?, ?, ?, ?)
-               '''
-
-            params = (user_id, username, first_name, last_name, role.value)
+            # Вставка или обновление существующего пользователя одним запросом
+            params = (user_id, username, first_name, last_name, _ROLE_VALUES[role])
 
-            result = await self._execute(query, params)
+            result = await self._execute(self._sql_upsert_user, params)
+            self._user_changed(user_id)
 
             if result is None:
-                Logger().get_logger().info(f"Пользователь {user_id} успешно добавлен с ролью {role.value}")
+                logger.info("Пользователь %s успешно добавлен с ролью %s", user_id, _ROLE_VALUES[role])
                 return ErrorCode.SUCCESSFUL
             else:
-                Logger().get_logger().error(f"Ошибка добавления пользователя: {result}")
+                logger.error("Ошибка добавления пользователя: %s", result)
                 return ErrorCode.FAILED_ERROR
 
         except Exception as e:
-            Logger().get_logger().error(f"Ошибка добавления пользователя: {str(e)}")
+            logger.error("Ошибка добавления пользователя: %s", e)
             return ErrorCode.INIT_DB_ERROR
 
     async def update_user(
@@ -143,7 +211,7 @@ class DatabaseUserHandler(BaseDatabaseHandler):
                 params.append(last_name)
             if role is not None:
                 update_fields.append("role = ?")
-                params.append(role.value)
+                params.append(_ROLE_VALUES[role])
 
             if not update_fields:
                 return ErrorCode.SUCCESSFUL
@@ -156,17 +224,21 @@ class DatabaseUserHandler(BaseDatabaseHandler):
                 WHERE user_id = ?
             '''
 
-            result = await self._execute(query, tuple(params))
+            rowcount = await self._execute_rowcount(query, tuple(params))
+            self._user_changed(user_id)
 
-            if result is None:
-                Logger().get_logger().info(f"Данные пользователя {user_id} успешно обновлены")
-                return ErrorCode.SUCCESSFUL
-            else:
-                Logger().get_logger().error(f"Ошибка обновления пользователя: {result}")
+            if rowcount is None:
+                logger.error("Ошибка обновления пользователя %s", user_id)
                 return ErrorCode.FAILED_ERROR
+            if rowcount == 0:
+                logger.warning("Попытка обновить несуществующего пользователя %s", user_id)
+                return ErrorCode.USER_NOT_FOUND
+
+            logger.info("Данные пользователя %s успешно обновлены", user_id)
+            return ErrorCode.SUCCESSFUL
 
         except Exception as e:
-            Logger().get_logger().error(f"Ошибка обновления пользователя: {str(e)}")
+            logger.error("Ошибка обновления пользователя: %s", e)
             return ErrorCode.INIT_DB_ERROR
 
     async def update_user_role(self, user_id: int, role: UserRole) -> ErrorCode:
@@ -178,6 +250,52 @@ class DatabaseUserHandler(BaseDatabaseHandler):
         """
         return await self.update_user(user_id, role=role)
 
+    async def _init_one_admin(
+            self,
+            admin_id: int,
+            bot: Optional[Bot],
+            semaphore: asyncio.Semaphore
+    ) -> tuple[int, Optional[str], str, str, str]:
+        """
+        Собирает данные администратора для записи в БД (через API Telegram, если бот доступен)
+
+        :param admin_id: ID администратора
+        :param bot: Экземпляр бота для получения данных пользователя (опционально)
+        :param semaphore: Ограничение одновременных запросов к Telegram API
+        :return: Параметры запроса записи пользователя
+        """
+        username = None
+        if bot:
+            try:
+                # Получаем информацию о пользователе через API Telegram
+                async with semaphore:
+                    user_chat = await bot.get_chat(admin_id)
+
+                username = user_chat.username
+                first_name = user_chat.first_name
+                last_name = user_chat.last_name
+
+                logger.debug(
+                    "Получены данные пользователя %s: username=%s, first_name=%s, last_name=%s",
+                    admin_id, username, first_name, last_name
+                )
+
+            except Exception as e:
+                logger.warning(
+                    "Не удалось получить данные пользователя %s через бота: %s. Используем значения по умолчанию",
+                    admin_id, e
+                )
+                first_name = "Admin"
+                last_name = "User"
+        else:
+            logger.warning(
+                "Бот не доступен для получения данных пользователя %s. Используем значения по умолчанию", admin_id
+            )
+            first_name = "Admin"
+            last_name = "User"
+
+        return admin_id, username, first_name, last_name, _ROLE_VALUES[UserRole.ADMIN]
+
     async def init_admin_users(self, admin_ids: list[int], bot: Optional[Bot] = None) -> ErrorCode:
         """
         Инициализирует администраторов в БД с получением данных пользователя
@@ -187,61 +305,33 @@ class DatabaseUserHandler(BaseDatabaseHandler):
         :return: Результат операции
         """
         try:
-            Logger().get_logger().info(f"Начало инициализации администраторов: {admin_ids}")
+            logger.info("Начало инициализации администраторов: %s", admin_ids)
 
             success_count = 0
             error_count = 0
             skipped_count = 0
 
-            for admin_id in admin_ids:
-                username = None
-                if bot:
-                    try:
-                        # Получаем информацию о пользователе через API Telegram
-                        user_chat = await bot.get_chat(admin_id)
-
-                        username = user_chat.username
-                        first_name = user_chat.first_name
-                        last_name = user_chat.last_name
-
-                        Logger().get_logger().debug(
-                            f"Получены данные пользователя {admin_id}: "
-                            f"username={username}, first_name={first_name}, last_name={last_name}"
-                        )
-
-                    except Exception as e:
-                        Logger().get_logger().warning(
-                            f"Не удалось получить данные пользователя {admin_id} через бота: {str(e)}. "
-                            f"Используем значения по умолчанию"
-                        )
-                        first_name = "Admin"
-                        last_name = "User"
-                else:
-                    Logger().get_logger().warning(
-                        f"Бот не доступен для получения данных пользователя {admin_id}. "
-                        f"Используем значения по умолчанию"
-                    )
-                    first_name = "Admin"
-                    last_name = "User"
-
-                result = await self.add_user(
-                    user_id=admin_id,
-                    username=username,
-                    first_name=first_name,
-                    last_name=last_name,
-                    role=UserRole.ADMIN
-                )
+            # Ограничение одновременных запросов к Telegram API
+            semaphore = asyncio.Semaphore(self.ADMIN_INIT_CONCURRENCY)
+
+            rows = await asyncio.gather(
+                *(self._init_one_admin(admin_id, bot, semaphore) for admin_id in admin_ids)
+            )
+
+            # Все администраторы записываются одной транзакцией
+            if await self._execute_many(self._sql_upsert_user, rows):
+                success_count = len(rows)
+                logger.info("Администраторы %s успешно инициализированы", admin_ids)
+            else:
+                error_count = len(rows)
+                logger.error("Ошибка записи администраторов %s в БД", admin_ids)
 
-                if result == ErrorCode.SUCCESSFUL:
-                    success_count += 1
-                    Logger().get_logger().info(f"Администратор {admin_id} успешно инициализирован")
-                else:
-                    error_count += 1
-                    Logger().get_logger().error(f"Ошибка инициализации администратора {admin_id}: {result}")
+            for admin_id in admin_ids:
+                self._user_changed(admin_id)
 
-            Logger().get_logger().info(
-                f"Инициализация администраторов завершена: "
-                f"успешно - {success_count}, пропущено - {skipped_count}, ошибок - {error_count}"
+            logger.info(
+                "Инициализация администраторов завершена: успешно - %s, пропущено - %s, ошибок - %s",
+                success_count, skipped_count, error_count
             )
 
             if error_count == 0 and success_count > 0:
@@ -249,13 +339,13 @@ class DatabaseUserHandler(BaseDatabaseHandler):
             elif success_count > 0:
                 return ErrorCode.PARTIAL_SUCCESS
             elif skipped_count > 0:
-                Logger().get_logger().info("Все администраторы уже существуют в БД")
+                logger.info("Все администраторы уже существуют в БД")
                 return ErrorCode.SUCCESSFUL
             else:
                 return ErrorCode.FAILED_ERROR
 
         except Exception as e:
-            Logger().get_logger().error(f"Критическая ошибка при инициализации администраторов: {str(e)}")
+            logger.error("Критическая ошибка при инициализации администраторов: %s", e)
             return ErrorCode.INIT_DB_ERROR
 
     async def get_all_users(self) -> list[dict]:
@@ -267,26 +357,26 @@ class DatabaseUserHandler(BaseDatabaseHandler):
         try:
             result = await self._execute(
                 f'SELECT user_id, username, first_name, last_name, role FROM "{self._table_name}" ORDER BY user_id',
-                fetch=True
+                fetch=True,
+                as_tuples=True
             )
 
             if not result:
                 return []
 
-            users = []
-            for row in result:
-                users.append({
-                    'user_id': row['user_id'],
-                    'username': row['username'],
-                    'first_name': row['first_name'],
-                    'last_name': row['last_name'],
-                    'role': UserRole(row['role']) if row['role'] else UserRole.USER
-                })
-
-            return users
+            return [
+                {
+                    'user_id': user_id,
+                    'username': username,
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'role': _role_from_str(role)
+                }
+                for user_id, username, first_name, last_name, role in result
+            ]
 
         except Exception as e:
-            Logger().get_logger().error(f"Ошибка получения списка пользователей: {str(e)}")
+            logger.error("Ошибка получения списка пользователей: %s", e)
             return []
 
     async def delete_user(self, user_id: int) -> ErrorCode:
@@ -297,22 +387,30 @@ class DatabaseUserHandler(BaseDatabaseHandler):
         :return: Результат операции
         """
         try:
-            if not await self.user_exists(user_id):
-                Logger().get_logger().warning(f"Попытка удалить несуществующего пользователя {user_id}")
-                return ErrorCode.FAILED_ERROR
-
-            result = await self._execute(
+            rowcount = await self._execute_rowcount(
                 f'DELETE FROM "{self._table_name}" WHERE user_id = ?',
                 (user_id,)
             )
+            self._user_changed(user_id)
 
-            if result is None:
-                Logger().get_logger().info(f"Пользователь {user_id} успешно удален")
-                return ErrorCode.SUCCESSFUL
-            else:
-                Logger().get_logger().error(f"Ошибка удаления пользователя {user_id}: {result}")
+            if rowcount is None:
+                logger.error("Ошибка удаления пользователя %s", user_id)
                 return ErrorCode.FAILED_ERROR
+            if rowcount == 0:
+                logger.warning("Попытка удалить несуществующего пользователя %s", user_id)
+                return ErrorCode.FAILED_ERROR
+
+            logger.info("Пользователь %s успешно удален", user_id)
+            return ErrorCode.SUCCESSFUL
 
         except Exception as e:
-            Logger().get_logger().error(f"Ошибка при удалении пользователя {user_id}: {str(e)}")
+            logger.error("Ошибка при удалении пользователя %s: %s", user_id, e)
             return ErrorCode.INIT_DB_ERROR
+
+
+@functools.cache
+def get_user_handler() -> DatabaseUserHandler:
+    """
+    Возвращает общий экземпляр обработчика пользователей
+    """
+    return DatabaseUserHandler()
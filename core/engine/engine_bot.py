@@ -1,14 +1,17 @@
 from aiogram import Bot, Dispatcher
 from aiogram.fsm.storage.memory import MemoryStorage
 
-from core import Config
-from core.database_manager.db_bot_settings_handler import DatabaseBotSettingsHandler
-from core.database_manager.db_users_handler import DatabaseUserHandler
+from core import get_config
+from core.database_manager.db_bot_settings_handler import get_db_settings_handler
+from core.database_manager.db_users_handler import get_user_handler
 from core.middleware.auth_middleware import AuthMiddleware
+from core.middleware.chat_order_middleware import ChatOrderMiddleware
 from core.router_recorder.router_recorder import RoutersRecorder
 from errors import ErrorCode
 from logger import Logger
 
+logger = Logger().get_logger()
+
 
 class EngineBot:
     """
@@ -21,6 +24,8 @@ class EngineBot:
         Создает экземпляр EngineBot
         """
         self._dp = Dispatcher(storage=MemoryStorage())
+        # Общий обработчик пользователей (тот же экземпляр, что возвращает get_user_handler)
+        self._user_handler = get_user_handler()
         self._setup_middleware()
         self._dp.include_router(RoutersRecorder.setup_main_router())
 
@@ -28,13 +33,16 @@ class EngineBot:
         """
         Настройка middleware для бота
         """
-        auth_middleware = AuthMiddleware()
-        # Регистрируем middleware для всех типов сообщений
-        self._dp.message.middleware(auth_middleware)
-        self._dp.callback_query.middleware(auth_middleware)
+        # Апдейты одного чата обрабатываются по очереди, разные чаты - параллельно
+        self._dp.update.outer_middleware(ChatOrderMiddleware())
+
+        self._auth_middleware = AuthMiddleware(self._user_handler)
+        # Регистрируем middleware только для событий, у которых есть пользователь
+        self._dp.message.middleware(self._auth_middleware)
+        self._dp.callback_query.middleware(self._auth_middleware)
         # Можно добавить и для других типов событий при необходимости
-        # self._dp.edited_message.middleware(auth_middleware)
-        # self._dp.channel_post.middleware(auth_middleware)
+        # self._dp.edited_message.middleware(self._auth_middleware)
+        # self._dp.channel_post.middleware(self._auth_middleware)
 
     async def _init_admins(self) -> ErrorCode:
         """
@@ -43,83 +51,92 @@ class EngineBot:
         :return: Результат операции
         """
         try:
-            Logger().get_logger().info("Начало инициализации администраторов")
+            logger.info("Начало инициализации администраторов")
 
-            admin_ids = Config().data.admin_ids
+            admin_ids = get_config().data.admin_ids
 
             if not admin_ids:
-                Logger().get_logger().warning("Список администраторов пуст в конфигурации")
+                logger.warning("Список администраторов пуст в конфигурации")
                 return ErrorCode.SUCCESSFUL
 
-            user_handler = DatabaseUserHandler()
-            result = await user_handler.init_admin_users(admin_ids, self._bot)
+            result = await self._user_handler.init_admin_users(admin_ids, self._bot)
 
             if result == ErrorCode.SUCCESSFUL:
-                Logger().get_logger().info("Администраторы успешно инициализированы")
+                logger.info("Администраторы успешно инициализированы")
             elif result == ErrorCode.PARTIAL_SUCCESS:
-                Logger().get_logger().warning("Некоторые администраторы не были инициализированы")
+                logger.warning("Некоторые администраторы не были инициализированы")
             else:
-                Logger().get_logger().error("Ошибка инициализации администраторов")
+                logger.error("Ошибка инициализации администраторов")
 
             return result
 
         except Exception as e:
-            Logger().get_logger().error(f"Критическая ошибка при инициализации администраторов: {str(e)}")
+            logger.error("Критическая ошибка при инициализации администраторов: %s", e)
             return ErrorCode.INIT_DB_ERROR
 
     async def init(self) -> ErrorCode:
         """
         Инициализация бота
         """
-        Logger().get_logger().info("Начало инициализации бота")
+        logger.info("Начало инициализации бота")
 
         try:
-            db_config_bot = DatabaseBotSettingsHandler()
-            Logger().get_logger().debug("Создан экземпляр DatabaseBotSettingsHandler")
-            Logger().get_logger().debug("Попытка получения токена из базы данных")
+            db_config_bot = get_db_settings_handler()
+            logger.debug("Получен экземпляр DatabaseBotSettingsHandler")
+            logger.debug("Попытка получения токена из базы данных")
             token_bot = await db_config_bot.get_token()
 
             if token_bot is None:
-                Logger().get_logger().warning("Токен не найден в базе данных. Попытка установки нового токена")
+                logger.warning("Токен не найден в базе данных. Попытка установки нового токена")
 
                 set_result = await db_config_bot.set_token()
                 if set_result != ErrorCode.SUCCESSFUL:
-                    Logger().get_logger().error(f"Ошибка установки токена в базу данных: {set_result}")
+                    logger.error("Ошибка установки токена в базу данных: %s", set_result)
                     return ErrorCode.TOKEN_ERROR
 
-                Logger().get_logger().info("Токен успешно установлен в базу данных")
-                Logger().get_logger().debug("Повторная попытка получения токена из базы данных")
+                logger.info("Токен успешно установлен в базу данных")
+                logger.debug("Повторная попытка получения токена из базы данных")
                 token_bot = await db_config_bot.get_token()
 
             if token_bot:
-                Logger().get_logger().info("Токен успешно получен. Создание экземпляра Bot")
+                logger.info("Токен успешно получен. Создание экземпляра Bot")
                 self._bot = Bot(token=token_bot)
                 admin_init_result = await self._init_admins()
                 if admin_init_result == ErrorCode.FAILED_ERROR:
-                    Logger().get_logger().error("Критическая ошибка инициализации администраторов")
+                    logger.error("Критическая ошибка инициализации администраторов")
                     return ErrorCode.FAILED_ERROR
 
-                Logger().get_logger().info("Бот успешно инициализирован")
+                await self._auth_middleware.warm_up()
+
+                logger.info("Бот успешно инициализирован")
                 return ErrorCode.SUCCESSFUL
             else:
-                Logger().get_logger().error("Не удалось получить токен после установки")
+                logger.error("Не удалось получить токен после установки")
                 return ErrorCode.TOKEN_ERROR
 
         except Exception as e:
-            Logger().get_logger().error(f"Критическая ошибка при инициализации бота: {str(e)}", exc_info=True)
+            logger.error("Критическая ошибка при инициализации бота: %s", e, exc_info=True)
             return ErrorCode.INIT_DB_ERROR
 
     async def start(self) -> None:
         """
         Запуск бота
         """
-        Logger().get_logger().info("Запуск бота: начало процедуры start_polling")
+        logger.info("Запуск бота: начало процедуры start_polling")
 
         try:
-            await self._dp.start_polling(self._bot)
-            Logger().get_logger().info("Бот успешно запущен и начал обработку сообщений")
+            # Каждый апдейт обрабатывается отдельной задачей, порядок внутри чата сохраняет ChatOrderMiddleware.
+            # Запрашиваются только типы апдейтов, для которых есть обработчики
+            await self._dp.start_polling(
+                self._bot,
+                polling_timeout=get_config().data.polling_timeout,
+                handle_as_tasks=True,
+                allowed_updates=self._dp.resolve_used_update_types(),
+                handle_signals=True
+            )
+            logger.info("Бот успешно запущен и начал обработку сообщений")
         except Exception as e:
-            Logger().get_logger().critical(f"Критическая ошибка при запуске бота: {str(e)}", exc_info=True)
+            logger.critical("Критическая ошибка при запуске бота: %s", e, exc_info=True)
             raise
         finally:
-            Logger().get_logger().info("Завершение работы бота")
+            logger.info("Завершение работы бота")
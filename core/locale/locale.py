@@ -1,5 +1,8 @@
-import re
+import logging
+import string
+import threading
 from abc import ABC
+from pathlib import Path
 from typing import Any
 
 from _singleton import Singleton
@@ -10,18 +13,26 @@ from utils import load_config
 
 logger = Logger().get_logger()
 
+# Разбор текстовок на плейсхолдеры str.format
+_FORMATTER = string.Formatter()
+
 
 class BaseLocaleModule(ABC):
     """
     Базовый класс для модуля локализации
     """
+    __slots__ = ("_data", "_processed_data", "_expand_memo", "_compiled")
 
     def __init__(self, data: dict[str, Any]) -> None:
-        logger.debug(f"Инициализация BaseLocaleModule с {len(data)} элементами")
+        logger.debug("Инициализация BaseLocaleModule с %s элементами", len(data))
         self._data = data
         self._processed_data = {}
+        # Уже раскрытые шаблоны: каждая текстовка раскрывается не более одного раза
+        self._expand_memo: dict[str, str] = {}
+        # Разобранные шаблоны для render: ключ -> сегменты (литерал, имя плейсхолдера) или None для str.format
+        self._compiled: dict[str, tuple[tuple[str, str | None], ...] | None] = {}
         self._process_data()
-        logger.debug(f"BaseLocaleModule инициализирован, обработано {len(self._processed_data)} значений")
+        logger.debug("BaseLocaleModule инициализирован, обработано %s значений", len(self._processed_data))
 
     def _process_data(self) -> None:
         """
@@ -30,67 +41,139 @@ class BaseLocaleModule(ABC):
         logger.debug("Начало обработки данных модуля")
         processed_count = 0
         expanded_count = 0
+        # Строковые значения модуля - кандидаты для подстановки (строятся один раз)
+        str_map = {k: v for k, v in self._data.items() if isinstance(v, str)}
 
         for key, value in self._data.items():
             if isinstance(value, str):
                 original_value = value
-                self._processed_data[key] = self._expand_value(value, self._data.items())
+                self._processed_data[key] = self._expand_value(value, str_map)
                 if self._processed_data[key] != original_value:
                     expanded_count += 1
                     logger.debug(
-                        f"Значение для ключа '{key}' было раскрыто: '{original_value}' -> '{self._processed_data[key]}'")
+                        "Значение для ключа '%s' было раскрыто: '%s' -> '%s'",
+                        key, original_value, self._processed_data[key]
+                    )
                 processed_count += 1
             else:
                 self._processed_data[key] = value
                 processed_count += 1
 
-        logger.info(f"Обработка данных модуля завершена: {processed_count} значений, {expanded_count} раскрыто")
+        logger.info("Обработка данных модуля завершена: %s значений, %s раскрыто", processed_count, expanded_count)
 
-    def _expand_value(self, value: str, config: Any, visited: set = None) -> str:
+    @staticmethod
+    def _field_names(value: str) -> set[str]:
         """
-        Форматирование текстовки
+        Возвращает имена плейсхолдеров str.format, использованных в текстовке
+
+        :param value: Текстовка
         """
-        if visited is None:
-            visited = set()
+        try:
+            return {field_name for _, field_name, _, _ in _FORMATTER.parse(value) if field_name}
+        except ValueError:
+            # Некорректные фигурные скобки - текстовка не является шаблоном
+            return set()
 
+    def _expand_value(self, value: str, config: dict[str, str], visited: set = None) -> str:
+        """
+        Форматирование текстовки
+
+        :param value: Текстовка
+        :param config: Строковые значения модуля для подстановки
+        :param visited: Текстовки, раскрываемые в текущей цепочке (защита от циклических ссылок)
+        """
         if not isinstance(value, str):
             return value
 
-        pattern = r'\{.*\}'
-        if not re.search(pattern, value):
+        memo = self._expand_memo
+        if value in memo:
+            return memo[value]
+
+        if visited is None:
+            visited = set()
+
+        needed = self._field_names(value)
+        if not needed:
+            memo[value] = value
             return value
 
-        value_hash = hash(value)
-        if value_hash in visited:
-            logger.warning(f"Обнаружена циклическая ссылка при раскрытии значения: '{value}'")
+        if value in visited:
+            logger.warning("Обнаружена циклическая ссылка при раскрытии значения: '%s'", value)
             return value
-        visited.add(value_hash)
 
-        replaces = {k: v for k, v in config if k in value and isinstance(v, str)}
+        replaces = {k: config[k] for k in needed if k in config}
         if not replaces:
-            logger.debug(f"Не найдены замены для значения: '{value}'")
+            logger.debug("Не найдены замены для значения: '%s'", value)
+            memo[value] = value
             return value
 
-        logger.debug(f"Найдены замены для '{value}': {list(replaces.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Найдены замены для '%s': %s", value, list(replaces.keys()))
 
+        visited.add(value)
         for k, v in replaces.items():
-            if re.search(pattern, v):
-                logger.debug(f"Рекурсивное раскрытие значения для ключа '{k}': '{v}'")
-                replaces[k] = self._expand_value(v, config, visited)
-
-        result = value.format_map(replaces)
-        logger.debug(f"Значение раскрыто: '{value}' -> '{result}'")
+            expanded = self._expand_value(v, config, visited)
+            if expanded != v:
+                logger.debug("Рекурсивное раскрытие значения для ключа '%s': '%s'", k, v)
+                replaces[k] = expanded
+        visited.discard(value)
+
+        result = memo[value] = value.format_map(replaces)
+        logger.debug("Значение раскрыто: '%s' -> '%s'", value, result)
         return result
 
+    @staticmethod
+    def _compile(template: str) -> tuple[tuple[str, str | None], ...] | None:
+        """
+        Разбирает шаблон на сегменты (литерал, имя плейсхолдера)
+
+        :param template: Текстовка с плейсхолдерами str.format
+        :return: Сегменты шаблона или None, если шаблон использует возможности,
+            которые поддерживает только str.format (спецификаторы формата, доступ к атрибутам)
+        """
+        segments = []
+        try:
+            for literal, field_name, format_spec, conversion in _FORMATTER.parse(template):
+                if field_name is not None and (
+                        format_spec or conversion or not field_name.isidentifier()
+                ):
+                    return None
+                segments.append((literal, field_name))
+        except ValueError:
+            return None
+        return tuple(segments)
+
+    def render(self, key: str, **ctx: Any) -> str:
+        """
+        Получает текстовку по ключу и подставляет в нее значения.
+        Шаблон разбирается один раз при первом вызове
+
+        :param key: Ключ текстовки
+        :param ctx: Значения плейсхолдеров
+        :return: Готовый текст
+        """
+        try:
+            segments = self._compiled[key]
+        except KeyError:
+            template = self.get(key)
+            segments = self._compiled[key] = self._compile(template) if isinstance(template, str) else None
+
+        if segments is None:
+            return self.get(key).format(**ctx)
+        return "".join([
+            literal + str(ctx[field_name]) if field_name is not None else literal
+            for literal, field_name in segments
+        ])
+
     def get(self, key: str, default: str = "") -> str:
         """
         Получает текстовку по ключу
         """
         result = self._processed_data.get(key, default)
         if result == default:
-            logger.warning(f"Ключ '{key}' не найден в модуле, возвращено значение по умолчанию: '{default}'")
+            logger.warning("Ключ '%s' не найден в модуле, возвращено значение по умолчанию: '%s'", key, default)
         else:
-            logger.debug(f"Получено значение для ключа '{key}': '{result}'")
+            logger.debug("Получено значение для ключа '%s': '%s'", key, result)
         return result
 
 
@@ -98,9 +181,10 @@ class UIModule(BaseLocaleModule):
     """
     Модуль UI текстовок
     """
+    __slots__ = ()
 
     def __init__(self, data: dict[str, Any]) -> None:
-        logger.info(f"Инициализация UIModule с {len(data)} UI текстовками")
+        logger.info("Инициализация UIModule с %s UI текстовками", len(data))
         super().__init__(data)
         logger.info("UIModule успешно инициализирован")
 
@@ -109,9 +193,10 @@ class BotMessagesModule(BaseLocaleModule):
     """
     Модуль сообщений бота
     """
+    __slots__ = ()
 
     def __init__(self, data: dict[str, Any]) -> None:
-        logger.info(f"Инициализация BotMessagesModule с {len(data)} сообщениями бота")
+        logger.info("Инициализация BotMessagesModule с %s сообщениями бота", len(data))
         super().__init__(data)
         logger.info("BotMessagesModule успешно инициализирован")
 
@@ -120,9 +205,10 @@ class ButtonsModule(BaseLocaleModule):
     """
     Модуль текстовок кнопок
     """
+    __slots__ = ()
 
     def __init__(self, data: dict[str, Any]) -> None:
-        logger.info(f"Инициализация ButtonsModule с {len(data)} текстовками кнопок")
+        logger.info("Инициализация ButtonsModule с %s текстовками кнопок", len(data))
         super().__init__(data)
         logger.info("ButtonsModule успешно инициализирован")
 
@@ -131,6 +217,7 @@ class Locale(metaclass=Singleton):
     """
     Локализация бота с модульной структурой
     """
+    __slots__ = ("language", "modules", "_config", "_modules_config", "_modules_lock", "_ui", "_bot", "_buttons")
 
     def __init__(self, language: str = "ru") -> None:
         """
@@ -138,61 +225,88 @@ class Locale(metaclass=Singleton):
 
         :param language: Язык локализации
         """
-        logger.info(f"Инициализация локализации для языка: {language}")
+        logger.info("Инициализация локализации для языка: %s", language)
         self.language = language
         self.modules = {}
+        # Модули, еще не загруженные с диска: имя модуля -> (файл, имя класса)
+        self._modules_config: dict[str, tuple[Path, str]] = {}
+        self._modules_lock = threading.Lock()
+        # Модули для свойств ui/bot/buttons (определяются при первом обращении)
+        self._ui: BaseLocaleModule | None = None
+        self._bot: BaseLocaleModule | None = None
+        self._buttons: BaseLocaleModule | None = None
         self._config = self._load_config()
         self._load_modules()
-        logger.info(f"Локализация успешно инициализирована. Загружено модулей: {len(self.modules)}")
+        logger.info("Локализация успешно инициализирована. Зарегистрировано модулей: %s", len(self._modules_config))
 
     def _load_config(self) -> dict[str, Any]:
         """
         Загружает конфигурацию модулей
         """
-        logger.debug(f"Загрузка конфигурации модулей из: {LOCALE_MODULE_CONFIG}")
+        logger.debug("Загрузка конфигурации модулей из: %s", LOCALE_MODULE_CONFIG)
         try:
             config = load_config(LOCALE_MODULE_CONFIG)
-            logger.info(f"Конфигурация модулей успешно загружена, найдено модулей: {len(config.get('modules', {}))}")
+            logger.info("Конфигурация модулей успешно загружена, найдено модулей: %s", len(config.get('modules', {})))
             return config
         except Exception as e:
-            logger.error(f"Ошибка загрузки конфигурации модулей из {LOCALE_MODULE_CONFIG}: {e}")
+            logger.error("Ошибка загрузки конфигурации модулей из %s: %s", LOCALE_MODULE_CONFIG, e)
             raise
 
     def _load_modules(self) -> None:
         """
-        Загружает все модули локализации на основе конфига
+        Регистрирует модули локализации на основе конфига.
+        Файлы модулей читаются при первом обращении к модулю
         """
         modules_config = self._config.get("modules", {})
-        logger.info(f"Начало загрузки {len(modules_config)} модулей локализации")
-
-        loaded_count = 0
         for module_name, module_info in modules_config.items():
-            file_path = LOCALE_CONFIGS / module_info.get("file")
-            class_name = module_info.get("class_name")
+            self._modules_config[module_name] = (LOCALE_CONFIGS / module_info.get("file"), module_info.get("class_name"))
+
+        logger.info("Зарегистрировано %s модулей локализации", len(modules_config))
 
-            logger.debug(f"Обработка модуля '{module_name}': файл={file_path}, класс={class_name}")
+    def _get_module(self, module_name: str) -> BaseLocaleModule | None:
+        """
+        Возвращает модуль локализации, загружая его при первом обращении
+
+        :param module_name: Имя модуля
+        :return: Модуль или None, если модуль не найден или не загрузился
+        """
+        module = self.modules.get(module_name)
+        if module is not None:
+            return module
+
+        with self._modules_lock:
+            module = self.modules.get(module_name)
+            if module is not None:
+                return module
+
+            # Каждый модуль загружается не более одного раза, даже если загрузка не удалась
+            module_info = self._modules_config.pop(module_name, None)
+            if module_info is None:
+                return None
+            file_path, class_name = module_info
+
+            logger.debug("Обработка модуля '%s': файл=%s, класс=%s", module_name, file_path, class_name)
 
             if not file_path.exists():
-                logger.warning(f"Файл модуля '{module_name}' не найден: {file_path}")
-                continue
+                logger.warning("Файл модуля '%s' не найден: %s", module_name, file_path)
+                return None
 
             try:
                 data = load_config(file_path)
-                logger.debug(f"Данные модуля '{module_name}' загружены, элементов: {len(data)}")
+                logger.debug("Данные модуля '%s' загружены, элементов: %s", module_name, len(data))
 
                 module_class = self._get_module_class(class_name)
                 if not module_class:
-                    logger.error(f"Класс модуля '{class_name}' не найден для модуля '{module_name}'")
-                    continue
+                    logger.error("Класс модуля '%s' не найден для модуля '%s'", class_name, module_name)
+                    return None
 
-                self.modules[module_name] = module_class(data)
-                loaded_count += 1
-                logger.info(f"Модуль '{module_name}' успешно загружен")
+                module = self.modules[module_name] = module_class(data)
+                logger.info("Модуль '%s' успешно загружен", module_name)
+                return module
 
             except Exception as e:
-                logger.error(f"Ошибка загрузки модуля '{module_name}': {e}")
-
-        logger.info(f"Загрузка модулей завершена. Успешно загружено: {loaded_count}/{len(modules_config)}")
+                logger.error("Ошибка загрузки модуля '%s': %s", module_name, e)
+                return None
 
     def _get_module_class(self, class_name: str) -> type:
         """
@@ -207,9 +321,10 @@ class Locale(metaclass=Singleton):
         result = modules_map.get(class_name)
         if not result:
             logger.error(
-                f"Класс модуля '{class_name}' не найден в mappings. Доступные классы: {list(modules_map.keys())}")
+                "Класс модуля '%s' не найден в mappings. Доступные классы: %s", class_name, list(modules_map.keys())
+            )
         else:
-            logger.debug(f"Найден класс модуля: {class_name} -> {result}")
+            logger.debug("Найден класс модуля: %s -> %s", class_name, result)
 
         return result
 
@@ -221,37 +336,50 @@ class Locale(metaclass=Singleton):
         :param key: Ключ значения
         :param default: Значение по умолчанию
         """
-        logger.debug(f"Запрос значения: модуль='{module}', ключ='{key}'")
+        logger.debug("Запрос значения: модуль='%s', ключ='%s'", module, key)
 
-        if module not in self.modules:
-            logger.warning(f"Модуль '{module}' не найден. Доступные модули: {list(self.modules.keys())}")
+        locale_module = self._get_module(module)
+        if locale_module is None:
+            logger.warning("Модуль '%s' не найден. Доступные модули: %s", module, list(self.modules.keys()))
             return default
 
-        result = self.modules[module].get(key, default)
+        result = locale_module.get(key, default)
         if result == default:
-            logger.warning(f"Ключ '{key}' не найден в модуле '{module}'")
+            logger.warning("Ключ '%s' не найден в модуле '%s'", key, module)
         else:
-            logger.debug(f"Значение найдено: модуль='{module}', ключ='{key}' -> '{result}'")
+            logger.debug("Значение найдено: модуль='%s', ключ='%s' -> '%s'", module, key, result)
 
         return result
 
+    def _resolve_module(self, module_name: str) -> BaseLocaleModule:
+        """
+        Возвращает модуль локализации или пустой модуль, если он не найден
+
+        :param module_name: Имя модуля
+        """
+        module = self._get_module(module_name)
+        if module is None:
+            logger.warning("Модуль '%s' не найден, возвращен пустой модуль", module_name)
+            return BaseLocaleModule({})
+        return module
+
     @property
     def ui(self) -> BaseLocaleModule:
-        module = self.modules.get('ui', BaseLocaleModule({}))
-        if not self.modules.get('ui'):
-            logger.warning("Модуль 'ui' не найден, возвращен пустой модуль")
+        module = self._ui
+        if module is None:
+            module = self._ui = self._resolve_module('ui')
         return module
 
     @property
     def bot(self) -> BaseLocaleModule:
-        module = self.modules.get('bot_messages', BaseLocaleModule({}))
-        if not self.modules.get('bot_messages'):
-            logger.warning("Модуль 'bot_messages' не найден, возвращен пустой модуль")
+        module = self._bot
+        if module is None:
+            module = self._bot = self._resolve_module('bot_messages')
         return module
 
     @property
     def buttons(self) -> BaseLocaleModule:
-        module = self.modules.get('buttons', BaseLocaleModule({}))
-        if not self.modules.get('buttons'):
-            logger.warning("Модуль 'buttons' не найден, возвращен пустой модуль")
+        module = self._buttons
+        if module is None:
+            module = self._buttons = self._resolve_module('buttons')
         return module
@@ -1 +1,2 @@
 from .auth_middleware import AuthMiddleware
+from .chat_order_middleware import ChatOrderMiddleware
@@ -1,12 +1,19 @@
-from typing import Callable, Any, Awaitable
+import time
+from typing import Callable, Any, Awaitable, Optional
 
 from aiogram import BaseMiddleware
 from aiogram.dispatcher.flags import get_flag
 from aiogram.types import Message, User
 
-from core.database_manager.db_users_handler import DatabaseUserHandler
+from core.database_manager.db_users_handler import DatabaseUserHandler, get_user_handler, UserRole
+from core.router_recorder.router_recorder import RoutersRecorder
 from logger import Logger
 
+logger = Logger().get_logger()
+
+# Признак хендлера, отсутствующего в таблице ролей RoutersRecorder
+_UNKNOWN_HANDLER = object()
+
 
 class AuthMiddleware(BaseMiddleware):
     """
@@ -15,14 +22,69 @@ class AuthMiddleware(BaseMiddleware):
     Проверяет наличие пользователя в базе данных и его роль,
     а также контролирует доступ к защищенным ресурсам на основе ролей.
     """
+    # Время жизни записи кэша проверок (секунды)
+    CACHE_TTL = 60.0
+    # Максимальное число пользователей в кэше
+    CACHE_MAXSIZE = 10_000
 
-    def __init__(self) -> None:
+    def __init__(self, user_handler: Optional[DatabaseUserHandler] = None) -> None:
         """
         Инициализирует middleware.
 
-        Создает экземпляр DatabaseUserHandler для работы с пользователями в БД.
+        :param user_handler: Обработчик пользователей в БД (по умолчанию общий экземпляр get_user_handler)
+        """
+        self.user_handler = user_handler or get_user_handler()
+        # Кэш проверок: user_id -> (есть в БД, роль, момент истечения)
+        self._cache: dict[int, tuple[bool, Optional[UserRole], float]] = {}
+        # Пользователи, загруженные при запуске: user_id -> роль. Записи не устаревают,
+        # измененные пользователи удаляются отсюда слушателем изменений
+        self._known: dict[int, Optional[UserRole]] = {}
+        self.user_handler.add_change_listener(self.invalidate)
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Сбрасывает закэшированные данные пользователя
+
+        :param user_id: ID пользователя
+        """
+        self._cache.pop(user_id, None)
+        self._known.pop(user_id, None)
+
+    async def warm_up(self) -> int:
+        """
+        Загружает всех пользователей из БД, чтобы апдейты зарегистрированных пользователей
+        не обращались к БД. Пользователи, измененные после запуска, проверяются через кэш с TTL
+
+        :return: Количество загруженных пользователей
         """
-        self.user_handler = DatabaseUserHandler()
+        users = await self.user_handler.get_all_users()
+        self._known = {user['user_id']: user['role'] for user in users}
+
+        logger.info("Кэш авторизации заполнен: %s пользователей", len(self._known))
+        return len(self._known)
+
+    async def _get_auth(self, user_id: int) -> tuple[bool, Optional[UserRole]]:
+        """
+        Возвращает наличие пользователя в БД и его роль (из кэша, если запись не устарела)
+
+        :param user_id: ID пользователя
+        :return: Кортеж (есть в БД, роль)
+        """
+        if user_id in self._known:
+            return True, self._known[user_id]
+
+        entry = self._cache.get(user_id)
+        now = time.monotonic()
+        if entry is not None and entry[2] > now:
+            return entry[0], entry[1]
+
+        user_exists, user_role = await self.user_handler.get_user_auth(user_id)
+
+        if len(self._cache) >= self.CACHE_MAXSIZE:
+            # Вытесняем самую старую запись
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[user_id] = (user_exists, user_role, now + self.CACHE_TTL)
+        return user_exists, user_role
 
     async def __call__(
             self,
@@ -41,14 +103,15 @@ class AuthMiddleware(BaseMiddleware):
         """
         user: User = data.get("event_from_user")
 
+        # Сообщения от имени чата (анонимные админы, каналы) приходят без from_user
         if not user:
             return await handler(event, data)
 
         # Проверяем, есть ли пользователь в БД
-        user_exists = await self.user_handler.user_exists(user.id)
+        user_exists, user_role = await self._get_auth(user.id)
 
         if not user_exists:
-            Logger().get_logger().warning(f"Доступ запрещен для пользователя {user.id}")
+            logger.warning("Доступ запрещен для пользователя %s", user.id)
 
             # Если пользователя нет в БД, отправляем сообщение и прекращаем обработку
             if isinstance(event, Message):
@@ -59,16 +122,20 @@ class AuthMiddleware(BaseMiddleware):
             return None
 
         # Добавляем информацию о пользователе в data
-        user_role = await self.user_handler.get_user_role(user.id)
         data["user_role"] = user_role
         data["user_handler"] = self.user_handler
 
-        # Проверяем требуется ли админ доступ
-        handler_role = get_flag(data, "role")
-        if handler_role and user_role != handler_role:
-            Logger().get_logger().warning(
-                f"Попытка доступа к защищенному ресурсу: пользователь {user.id} "
-                f"(роль: {user_role.value}) пытался получить доступ к {handler_role.value}"
+        # Проверяем требуется ли админ доступ (роль хендлера собрана при создании роутеров)
+        handler_role = RoutersRecorder.get_handler_role(data.get("handler"), _UNKNOWN_HANDLER)
+        if handler_role is _UNKNOWN_HANDLER:
+            handler_role = get_flag(data, "role")
+            if handler_role is not None:
+                handler_role = UserRole(handler_role)
+        # Члены UserRole - синглтоны, поэтому достаточно сравнения по идентичности
+        if handler_role is not None and user_role is not handler_role:
+            logger.warning(
+                "Попытка доступа к защищенному ресурсу: пользователь %s (роль: %s) пытался получить доступ к %s",
+                user.id, user_role.value, handler_role.value
             )
             if isinstance(event, Message):
                 await event.answer("❌ У вас недостаточно прав для выполнения этой команды.")
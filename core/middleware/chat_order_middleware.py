@@ -0,0 +1,66 @@
+import asyncio
+from typing import Callable, Any, Awaitable
+
+from aiogram import BaseMiddleware
+from aiogram.types import Chat, TelegramObject
+
+
+class ChatOrderMiddleware(BaseMiddleware):
+    """
+    Middleware для упорядоченной обработки апдейтов внутри одного чата.
+
+    Апдейты обрабатываются отдельными задачами (handle_as_tasks), поэтому медленный
+    обработчик в одном чате не задерживает другие чаты. Внутри чата апдейты
+    выполняются строго по очереди, а общее число одновременно работающих
+    обработчиков ограничено.
+    """
+    # Максимальное число одновременно выполняемых обработчиков
+    MAX_CONCURRENT_UPDATES = 30
+
+    def __init__(self) -> None:
+        """
+        Инициализирует middleware.
+        """
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_UPDATES)
+        # Блокировки чатов и число ожидающих их апдейтов (запись удаляется, когда очередь чата пуста)
+        self._locks: dict[int, asyncio.Lock] = {}
+        self._waiters: dict[int, int] = {}
+
+    async def __call__(
+            self,
+            handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+            event: TelegramObject,
+            data: dict[str, Any]
+    ) -> Any:
+        """
+        Обрабатывает входящий апдейт.
+
+        :param handler: Следующий обработчик в цепочке
+        :param event: Входящий апдейт
+        :param data: Словарь с дополнительными данными
+
+        :return: Результат выполнения handler
+        """
+        chat: Chat = data.get("event_chat")
+
+        if not chat:
+            async with self._semaphore:
+                return await handler(event, data)
+
+        chat_id = chat.id
+        lock = self._locks.get(chat_id)
+        if lock is None:
+            lock = self._locks[chat_id] = asyncio.Lock()
+        self._waiters[chat_id] = self._waiters.get(chat_id, 0) + 1
+
+        try:
+            async with lock:
+                async with self._semaphore:
+                    return await handler(event, data)
+        finally:
+            waiters = self._waiters[chat_id] - 1
+            if waiters:
+                self._waiters[chat_id] = waiters
+            else:
+                del self._waiters[chat_id]
+                del self._locks[chat_id]
@@ -1,5 +1,8 @@
+from typing import Any
+
 from aiogram import Router
 
+from core.database_manager.db_users_handler import UserRole
 from logger import Logger
 
 
@@ -11,6 +14,10 @@ class RoutersRecorder:
     Фабрика для динамической регистрации маршрутов
     """
     _routers_factory = {}
+    # Главный роутер (создается один раз)
+    _main_router: Router | None = None
+    # Требуемая роль для каждого хендлера (ключ - id HandlerObject, None - роль не требуется)
+    _handler_roles: dict[int, UserRole | None] = {}
 
     @classmethod
     def record_router(cls, router_class: type) -> type:
@@ -19,7 +26,7 @@ class RoutersRecorder:
 
         :param router_class: Класс обработчика
         """
-        logger.info(f"Регистрируем класс: {router_class.__name__}")
+        logger.info("Регистрируем класс: %s", router_class.__name__)
         cls._routers_factory[router_class.__name__] = router_class
         return router_class
 
@@ -36,25 +43,60 @@ class RoutersRecorder:
         Создает все зарегистрированные роутеры
         """
         routers = []
-        for name, router_class in cls._routers_factory.items():
-            logger.info(f"🛠️ Создаем роутер: {name}")
+        append = routers.append
+        for router_class in cls._routers_factory.values():
             # Создаем новый экземпляр Router для каждого класса
             router_instance = Router()
             # Создаем обработчик, который регистрирует хендлеры в этом роутере
             router_class(router_instance)
-            routers.append(router_instance)
+            append(router_instance)
 
-        logger.info(f"✅ Создано {len(routers)} роутеров")
+        logger.info("🛠️ Создано %s роутеров: %s", len(routers), ", ".join(cls._routers_factory))
         return routers
 
     @classmethod
     def setup_main_router(cls) -> Router:
         """
-        Создает главный роутер со всеми зарегистрированными роутерами
+        Создает главный роутер со всеми зарегистрированными роутерами.
+        Повторные вызовы возвращают уже созданный роутер
         """
+        if cls._main_router is not None:
+            return cls._main_router
+
         main_router = Router()
         for router in cls.create_all_routers():
             main_router.include_router(router)
 
-        logger.info(f"✅ Создан главный роутер с {len(cls._routers_factory)} дочерними роутерами")
+        cls._collect_handler_roles(main_router)
+        logger.info("✅ Создан главный роутер с %s дочерними роутерами", len(cls._routers_factory))
+        cls._main_router = main_router
         return main_router
+
+    @classmethod
+    def _collect_handler_roles(cls, main_router: Router) -> None:
+        """
+        Один раз читает флаг role у всех зарегистрированных хендлеров.
+        Строковые значения флага приводятся к UserRole
+
+        :param main_router: Главный роутер
+        """
+        handler_roles = {}
+        for router in main_router.chain_tail:
+            for observer in router.observers.values():
+                for handler in observer.handlers:
+                    role = handler.flags.get("role")
+                    handler_roles[id(handler)] = UserRole(role) if role is not None else None
+
+        cls._handler_roles = handler_roles
+        logger.info("Собраны флаги ролей для %s хендлеров", len(handler_roles))
+
+    @classmethod
+    def get_handler_role(cls, handler: Any, default: Any = None) -> UserRole | None:
+        """
+        Возвращает роль, требуемую хендлером
+
+        :param handler: HandlerObject хендлера
+        :param default: Значение, если хендлер не найден в таблице ролей
+        :return: Требуемая роль, None если роль не требуется, или default
+        """
+        return cls._handler_roles.get(id(handler), default)
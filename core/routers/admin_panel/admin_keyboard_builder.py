@@ -1,56 +1,110 @@
+import functools
+from operator import attrgetter
+from typing import Any, Callable, Iterable
+
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from core.database_manager.db_players_handler import QuizPlayer
 from core.database_manager.db_users_handler import UserRole
 from core.locale.locale import Locale
 
+# Общая локализация модуля
+_LOCALE = Locale()
+
+# Текстовки кнопок админ-панели (статичны, поэтому читаются один раз при импорте)
+_BTN: dict[str, str] = {
+    key: _LOCALE.buttons.get(key)
+    for key in (
+        "btn_manage_users", "btn_manage_players", "btn_close", "btn_add_user", "btn_list_users",
+        "btn_delete_user", "btn_back", "btn_role_user", "btn_role_admin", "btn_cancel",
+        "btn_yes_delete", "btn_confirm_delete", "btn_skip",
+    )
+}
+
+# Частые текстовки кнопок подтверждения
+_CONFIRM_TXT = _BTN["btn_confirm_delete"]
+_CANCEL_TXT = _BTN["btn_cancel"]
+
+# Префиксы callback_data с ID пользователя/игрока
+_CB_CONFIRM_DELETE = "confirm_delete_"
+_CB_CANCEL_DELETE = "cancel_delete_"
+_CB_CONFIRM_DELETE_USER = "confirm_delete_user_"
+_CB_CONFIRM_DELETE_PLAYER = "confirm_delete_player_"
+_CB_DELETE_USER = "delete_user_"
+_CB_DELETE_PLAYER = "delete_player_"
+# Префикс callback_data страницы списка игроков (с номером страницы)
+_CB_PLAYERS_LIST_PAGE = "players_list_page_"
+
+# Поля игрока для кнопок списка (одним вызовом вместо трех обращений к атрибутам)
+_player_button_fields: Callable[[QuizPlayer], tuple[str, str, int]] = attrgetter("first_name", "last_name", "player_id")
+
+
+@functools.lru_cache(maxsize=256)
+def _markup(rows: tuple[tuple[str, str], ...], adjust: tuple[int, ...] = (1,)) -> InlineKeyboardMarkup:
+    """
+    Строит клавиатуру из кнопок (текст, callback_data). Одинаковые клавиатуры строятся один раз
+
+    :param rows: Кнопки клавиатуры (кортеж, чтобы аргумент был хэшируемым)
+    :param adjust: Количество кнопок в строках
+    """
+    keyboard = InlineKeyboardBuilder()
+    for text, callback_data in rows:
+        keyboard.button(text=text, callback_data=callback_data)
+
+    keyboard.adjust(*adjust)
+    return keyboard.as_markup()
+
+
+@functools.lru_cache(maxsize=256)
+def _confirm_delete_keyboard(confirm_callback_data: str, cancel_callback_data: str) -> InlineKeyboardMarkup:
+    """
+    Клавиатура подтверждения удаления (кэшируется по callback_data)
+
+    :param confirm_callback_data: Данные callback кнопки подтверждения
+    :param cancel_callback_data: Данные callback кнопки отмены
+    """
+    buttons = [
+        [
+            InlineKeyboardButton(text=_CONFIRM_TXT, callback_data=confirm_callback_data),
+            InlineKeyboardButton(text=_CANCEL_TXT, callback_data=cancel_callback_data)
+        ]
+    ]
+    return InlineKeyboardMarkup(inline_keyboard=buttons)
+
 
 class AdminKeyboardBuilder:
     """
     Построение клавиатур для админ-панели
     """
 
-    def __init__(self):
-        self.locale = Locale()
+    def __init__(self) -> None:
+        self.locale: Locale = _LOCALE
 
-    @property
+    @functools.cached_property
     def admin_main_menu(self) -> InlineKeyboardMarkup:
         """
         Основное меню админ-панели - ПЕРВЫЙ УРОВЕНЬ
         """
-        keyboard = InlineKeyboardBuilder()
-        buttons = [
-            (self.locale.buttons.get("btn_manage_users"), "manage_users_cmd"),
-            (self.locale.buttons.get("btn_manage_players"), "manage_players_cmd"),
-            (self.locale.buttons.get("btn_close"), "cancel_operation")
-        ]
+        return _markup((
+            (_BTN["btn_manage_users"], "manage_users_cmd"),
+            (_BTN["btn_manage_players"], "manage_players_cmd"),
+            (_BTN["btn_close"], "cancel_operation")
+        ))
 
-        for text, callback_data in buttons:
-            keyboard.button(text=text, callback_data=callback_data)
-
-        keyboard.adjust(1)
-        return keyboard.as_markup()
-
-    @property
+    @functools.cached_property
     def admin_users_management_menu(self) -> InlineKeyboardMarkup:
         """
         Основное меню админ-панели
         """
-        keyboard = InlineKeyboardBuilder()
-        buttons = [
-            (self.locale.buttons.get("btn_add_user"), "add_user_cmd"),
-            (self.locale.buttons.get("btn_list_users"), "users_list_cmd"),
-            (self.locale.buttons.get("btn_delete_user"), "delete_users_cmd"),
-            (self.locale.buttons.get("btn_close"), "cancel_operation")
-        ]
-
-        for text, callback_data in buttons:
-            keyboard.button(text=text, callback_data=callback_data)
-
-        keyboard.adjust(1)
-        return keyboard.as_markup()
-
-    @property
+        return _markup((
+            (_BTN["btn_add_user"], "add_user_cmd"),
+            (_BTN["btn_list_users"], "users_list_cmd"),
+            (_BTN["btn_delete_user"], "delete_users_cmd"),
+            (_BTN["btn_close"], "cancel_operation")
+        ))
+
+    @functools.cached_property
     def admin_players_management_menu(self) -> InlineKeyboardMarkup:
         """
         Клавиатура меню управления игроками
@@ -60,32 +114,31 @@ class AdminKeyboardBuilder:
             [InlineKeyboardButton(text="📋 Список игроков", callback_data="players_list_cmd")],
             [InlineKeyboardButton(text="🔄 Обновить уровни", callback_data="update_levels_cmd")],
             [InlineKeyboardButton(text="🗑️ Удалить игрока", callback_data="delete_players_cmd")],
-            [InlineKeyboardButton(text=self.locale.buttons.get("btn_back"), callback_data="back_to_admin")]
+            [InlineKeyboardButton(text=_BTN["btn_back"], callback_data="back_to_admin")]
         ]
         return InlineKeyboardMarkup(inline_keyboard=buttons)
 
-    @property
+    @functools.cached_property
     def back_to_players_management_keyboard(self) -> InlineKeyboardMarkup:
         """
         Клавиатура для возврата в меню управления игроками
         """
         buttons = [
-            [InlineKeyboardButton(text=self.locale.buttons.get("btn_back"), callback_data="manage_players_cmd")]
+            [InlineKeyboardButton(text=_BTN["btn_back"], callback_data="manage_players_cmd")]
         ]
         return InlineKeyboardMarkup(inline_keyboard=buttons)
 
-    @property
+    @functools.cached_property
     def role_selection_keyboard(self) -> InlineKeyboardMarkup:
         """
         Клавиатура выбора роли
         """
-        keyboard = InlineKeyboardBuilder()
-        keyboard.button(text=self.locale.buttons.get("btn_role_user"), callback_data="role_user")
-        keyboard.button(text=self.locale.buttons.get("btn_role_admin"), callback_data="role_admin")
-        keyboard.button(text=self.locale.buttons.get("btn_back"), callback_data="add_user_cmd")
-        keyboard.button(text=self.locale.buttons.get("btn_cancel"), callback_data="cancel_operation")
-        keyboard.adjust(2, 1, 1)
-        return keyboard.as_markup()
+        return _markup((
+            (_BTN["btn_role_user"], "role_user"),
+            (_BTN["btn_role_admin"], "role_admin"),
+            (_BTN["btn_back"], "add_user_cmd"),
+            (_BTN["btn_cancel"], "cancel_operation")
+        ), adjust=(2, 1, 1))
 
     # def create_user_list_keyboard(self, users: list[dict]) -> InlineKeyboardMarkup:
     #     """Клавиатура списка пользователей"""
@@ -95,121 +148,82 @@ class AdminKeyboardBuilder:
         """
         Клавиатура подтверждения удаления пользователя
         """
-        keyboard = InlineKeyboardBuilder()
-
-        buttons = [
-            (self.locale.buttons.get("btn_yes_delete"), f"confirm_delete_{user_id}"),
-            (self.locale.buttons.get("btn_cancel"), f"cancel_delete_{user_id}")
-        ]
-
-        for text, callback_data in buttons:
-            keyboard.button(text=text, callback_data=callback_data)
-
-        keyboard.adjust(2)
-        return keyboard.as_markup()
+        return _markup((
+            (_BTN["btn_yes_delete"], _CB_CONFIRM_DELETE + str(user_id)),
+            (_CANCEL_TXT, _CB_CANCEL_DELETE + str(user_id))
+        ), adjust=(2,))
 
     def create_single_button(self, text: str, callback_data: str) -> InlineKeyboardMarkup:
         """
         Кнопка назад
         """
-        keyboard = InlineKeyboardBuilder()
-        keyboard.button(text=text, callback_data=callback_data)
-        keyboard.adjust(1)
-        return keyboard.as_markup()
+        return _markup(((text, callback_data),))
 
-    def create_delete_user_list_keyboard(self, users: list[dict]) -> InlineKeyboardMarkup:
+    def create_delete_user_list_keyboard(self, users: list[dict[str, Any]]) -> InlineKeyboardMarkup:
         """
         Создает клавиатуру со списком пользователей для удаления
         """
         keyboard = InlineKeyboardBuilder()
+        button = keyboard.button
 
-        for user in users:
-            if user.get("role") == UserRole.ADMIN:
-                continue
-
-            username = f"@{user['username']}" if user['username'] else "без username"
-            keyboard.button(
+        # Администраторов удалить нельзя, поэтому они не попадают в список
+        for user in (user for user in users if user.get("role") != UserRole.ADMIN):
+            username = user['username']
+            username = f"@{username}" if username else "без username"
+            button(
                 text=f"🗑️ {user['first_name']} {user['last_name']} ({username})",
-                callback_data=f"delete_user_{user['user_id']}"
+                callback_data=_CB_DELETE_USER + str(user['user_id'])
             )
 
-        keyboard.button(text=self.locale.buttons.get("btn_back"), callback_data="back_to_admin")
+        button(text=_BTN["btn_back"], callback_data="back_to_admin")
         keyboard.adjust(1)
         return keyboard.as_markup()
 
-    def players_list_keyboard(self, players: list) -> InlineKeyboardMarkup:
+    def players_list_keyboard(self, players: Iterable[QuizPlayer]) -> InlineKeyboardMarkup:
         """Клавиатура для списка игроков"""
-        buttons = []
-
-        # Добавляем кнопки для каждого игрока
-        for player in players:
-            buttons.append([
-                InlineKeyboardButton(
-                    text=f"🗑️ {player.first_name} {player.last_name}",
-                    callback_data=f"delete_player_{player.player_id}"
-                )
-            ])
-
-        # Кнопка возврата
-        buttons.append([
-            InlineKeyboardButton(text="◀️ Назад", callback_data="manage_players_cmd")
-        ])
+        # Кнопки для каждого игрока и кнопка возврата
+        buttons = [
+            [InlineKeyboardButton(
+                text=f"🗑️ {first_name} {last_name}",
+                callback_data=_CB_DELETE_PLAYER + str(player_id)
+            )]
+            for first_name, last_name, player_id in map(_player_button_fields, players)
+        ]
+        buttons.append([InlineKeyboardButton(text="◀️ Назад", callback_data="manage_players_cmd")])
 
         return InlineKeyboardMarkup(inline_keyboard=buttons)
 
-    def players_delete_keyboard(self, players: list) -> InlineKeyboardMarkup:
-        """
-        Клавиатура для удаления игроков
+    # Клавиатура для удаления игроков совпадает со списком игроков
+    players_delete_keyboard = players_list_keyboard
+
+    def players_list_page_keyboard(self, page: int, pages: int) -> InlineKeyboardMarkup:
         """
-        buttons = []
+        Клавиатура страницы списка игроков: переход к соседним страницам и возврат в меню
 
-        # Добавляем кнопки для каждого игрока
-        for player in players:
-            buttons.append([
-                InlineKeyboardButton(
-                    text=f"🗑️ {player.first_name} {player.last_name}",
-                    callback_data=f"delete_player_{player.player_id}"
-                )
-            ])
+        :param page: Номер текущей страницы (с нуля)
+        :param pages: Количество страниц
+        """
+        if pages <= 1:
+            return self.back_to_players_management_keyboard
 
-        # Кнопка возврата
-        buttons.append([
-            InlineKeyboardButton(text="◀️ Назад", callback_data="manage_players_cmd")
-        ])
+        navigation: tuple[tuple[str, str], ...] = ()
+        if page > 0:
+            navigation += (("⬅️ Предыдущие", _CB_PLAYERS_LIST_PAGE + str(page - 1)),)
+        if page < pages - 1:
+            navigation += (("Следующие ➡️", _CB_PLAYERS_LIST_PAGE + str(page + 1)),)
 
-        return InlineKeyboardMarkup(inline_keyboard=buttons)
+        return _markup(
+            navigation + ((_BTN["btn_back"], "manage_players_cmd"),),
+            adjust=(len(navigation), 1)
+        )
 
     def confirm_delete_user_keyboard(self, user_id: int) -> InlineKeyboardMarkup:
-        buttons = [
-            [
-                InlineKeyboardButton(
-                    text=self.locale.buttons.get("btn_confirm_delete"),
-                    callback_data=f"confirm_delete_user_{user_id}"
-                ),
-                InlineKeyboardButton(
-                    text=self.locale.buttons.get("btn_cancel"),
-                    callback_data="cancel_delete_user"
-                )
-            ]
-        ]
-        return InlineKeyboardMarkup(inline_keyboard=buttons)
+        return _confirm_delete_keyboard(_CB_CONFIRM_DELETE_USER + str(user_id), "cancel_delete_user")
 
     def confirm_delete_player_keyboard(self, player_id: int) -> InlineKeyboardMarkup:
-        buttons = [
-            [
-                InlineKeyboardButton(
-                    text=self.locale.buttons.get("btn_confirm_delete"),
-                    callback_data=f"confirm_delete_player_{player_id}"
-                ),
-                InlineKeyboardButton(
-                    text=self.locale.buttons.get("btn_cancel"),
-                    callback_data="cancel_delete_player"
-                )
-            ]
-        ]
-        return InlineKeyboardMarkup(inline_keyboard=buttons)
+        return _confirm_delete_keyboard(_CB_CONFIRM_DELETE_PLAYER + str(player_id), "cancel_delete_player")
 
-    @property
+    @functools.cached_property
     def photo_upload_keyboard(self) -> InlineKeyboardMarkup:
         """
         Создает клавиатуру для загрузки фото с кнопкой пропуска
@@ -218,17 +232,17 @@ class AdminKeyboardBuilder:
         """
         buttons = [
             [InlineKeyboardButton(
-                text=self.locale.buttons.get("btn_skip"),
+                text=_BTN["btn_skip"],
                 callback_data="skip_photo"
             )],
             [InlineKeyboardButton(
-                text=self.locale.buttons.get("btn_cancel"),
+                text=_BTN["btn_cancel"],
                 callback_data="cancel_operation"
             )]
         ]
         return InlineKeyboardMarkup(inline_keyboard=buttons)
 
-    @property
+    @functools.cached_property
     def nickname_skip_keyboard(self) -> InlineKeyboardMarkup:
         """
         Создает клавиатуру для ввода ника с кнопкой пропуска
@@ -237,11 +251,11 @@ class AdminKeyboardBuilder:
         """
         buttons = [
             [InlineKeyboardButton(
-                text=self.locale.buttons.get("btn_skip"),
+                text=_BTN["btn_skip"],
                 callback_data="skip_nickname"
             )],
             [InlineKeyboardButton(
-                text=self.locale.buttons.get("btn_cancel"),
+                text=_BTN["btn_cancel"],
                 callback_data="cancel_operation"
             )]
         ]
@@ -1,7 +1,18 @@
+from typing import Any, Awaitable, Callable
+
 from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup
 
 from core.locale.locale import Locale
 
+# Общая локализация модуля
+_LOCALE = Locale()
+
+# Способ отправки по типу цели: новое сообщение или редактирование сообщения с кнопкой
+_SENDERS: dict[type, Callable[..., Awaitable[Any]]] = {
+    Message: lambda target, text, **kwargs: target.answer(text, **kwargs),
+    CallbackQuery: lambda target, text, **kwargs: target.message.edit_text(text, **kwargs),
+}
+
 
 class AdminMessageSender:
     """
@@ -9,19 +20,33 @@ class AdminMessageSender:
     """
 
     def __init__(self) -> None:
-        self.locale = Locale()
+        self.locale = _LOCALE
 
     @staticmethod
     async def send_or_edit_message(
             target: Message | CallbackQuery,
             text: str,
             reply_markup: InlineKeyboardMarkup = None,
-            parse_mode: str = "Markdown"
+            parse_mode: str | None = None
     ) -> None:
         """
-        Универсальная отправка/редактирование сообщения
+        Универсальная отправка/редактирование сообщения.
+        По умолчанию текст отправляется без разметки: Markdown передается явно только для текстовок с разметкой
+
+        :param target: Сообщение или callback запрос
+        :param text: Текст сообщения
+        :param reply_markup: Клавиатура
+        :param parse_mode: Режим разметки текста (None - без разметки)
         """
-        if isinstance(target, Message):
-            await target.answer(text, reply_markup=reply_markup, parse_mode=parse_mode)
-        else:
-            await target.message.edit_text(text, reply_markup=reply_markup, parse_mode=parse_mode)
+        kwargs = {"reply_markup": reply_markup}
+        if parse_mode:
+            kwargs["parse_mode"] = parse_mode
+
+        sender = _SENDERS.get(type(target))
+        if sender is None:
+            # Подклассы и подмены целей (например, в тестах) определяются через isinstance
+            sender = next((func for cls, func in _SENDERS.items() if isinstance(target, cls)), None)
+            if sender is None:
+                raise TypeError(f"Неподдерживаемый тип цели сообщения: {type(target).__name__}")
+
+        await sender(target, text, **kwargs)
@@ -1,10 +1,16 @@
+import asyncio
+from operator import attrgetter
+from typing import Any, Callable
+
 from aiogram import Router, F
+from aiogram.dispatcher.event.handler import CallableObject
+from aiogram.enums import ParseMode
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, CallbackQuery
 
-from core.database_manager.db_players_handler import DatabaseQuizPlayerHandler
-from core.database_manager.db_users_handler import UserRole, DatabaseUserHandler
+from core.database_manager.db_players_handler import get_players_handler
+from core.database_manager.db_users_handler import UserRole, get_user_handler
 from core.router_recorder import RoutersRecorder
 from core.routers import BaseRouter
 from core.routers.admin_panel import AdminStates, AdminMessageSender, AdminKeyboardBuilder, PlayersManagerService
@@ -17,6 +23,35 @@ class AdminRouter(BaseRouter):
     """
     Роутер для административных команд
     """
+    # Маршруты callback: (тип совпадения, callback_data или префикс, путь к обработчику).
+    # Префиксы проверяются в порядке объявления
+    _ROUTES = (
+        # Возврат в админ панель и отмена
+        ("exact", "back_to_admin", attrgetter("_back_to_admin_panel")),
+        ("exact", "cancel_operation", attrgetter("_cancel_operation")),
+        # Работа с пользователями
+        ("exact", "manage_users_cmd", attrgetter("user_manager.manage_users_panel")),
+        ("exact", "add_user_cmd", attrgetter("user_manager.add_user_callback")),
+        ("exact", "users_list_cmd", attrgetter("user_manager.users_list_callback")),
+        ("exact", "delete_users_cmd", attrgetter("user_manager.delete_users_callback")),
+        ("prefix", "role_", attrgetter("user_manager.process_role_callback")),
+        ("prefix", "delete_user_", attrgetter("user_manager.delete_user_callback")),
+        ("prefix", "confirm_delete_user_", attrgetter("user_manager.confirm_delete_callback")),
+        ("prefix", "cancel_delete_user", attrgetter("user_manager.cancel_delete_callback")),
+        # Работа с игроками
+        ("exact", "manage_players_cmd", attrgetter("players_manager.manage_players_panel")),
+        ("exact", "add_player_cmd", attrgetter("players_manager.add_player_callback")),
+        ("exact", "players_list_cmd", attrgetter("players_manager.players_list_callback")),
+        ("prefix", "players_list_page_", attrgetter("players_manager.players_list_callback")),
+        ("exact", "delete_players_cmd", attrgetter("players_manager.delete_players_callback")),
+        ("exact", "cancel_player_operation", attrgetter("players_manager.cancel_operation")),
+        ("prefix", "delete_player_", attrgetter("players_manager.delete_player_callback")),
+        ("prefix", "confirm_delete_player_", attrgetter("players_manager.confirm_delete_player_callback")),
+        ("exact", "cancel_delete_player", attrgetter("players_manager.cancel_delete_player_callback")),
+        ("exact", "skip_photo", attrgetter("players_manager.skip_photo_callback")),
+        ("exact", "skip_nickname", attrgetter("players_manager.skip_nickname_callback")),
+        ("exact", "update_levels_cmd", attrgetter("players_manager.update_all_levels_callback")),
+    )
 
     def __init__(self, router: Router) -> None:
         """
@@ -24,8 +59,8 @@ class AdminRouter(BaseRouter):
 
         :param router: Роутер aiogram для регистрации обработчиков
         """
-        self.user_handler = DatabaseUserHandler()
-        self.players_handler = DatabaseQuizPlayerHandler()
+        self.user_handler = get_user_handler()
+        self.players_handler = get_players_handler()
         self.keyboard = AdminKeyboardBuilder()
         self.user_manager = UsersManagerService(
             user_handler=self.user_handler,
@@ -47,14 +82,15 @@ class AdminRouter(BaseRouter):
         :return: True если пользователь администратор, иначе False
         """
         try:
+            # Роль берется из кэша обработчика пользователей
             user_role = await self.user_handler.get_user_role(user_id)
-            is_admin = user_role == UserRole.ADMIN if user_role else False
+            is_admin = user_role == UserRole.ADMIN
 
-            self.logger.debug(f"Проверка прав доступа для {user_id}: роль={user_role}, is_admin={is_admin}")
+            self.logger.debug("Проверка прав доступа для %s: роль=%s, is_admin=%s", user_id, user_role, is_admin)
             return is_admin
 
         except Exception as e:
-            self.logger.error(f"Ошибка при проверке прав доступа для {user_id}: {str(e)}")
+            self.logger.error("Ошибка при проверке прав доступа для %s: %s", user_id, e)
             return False
 
     def _register_handlers(self) -> None:
@@ -66,17 +102,76 @@ class AdminRouter(BaseRouter):
         # Команды администратора - оставляем только /admin
         self.router.message(Command("admin"))(self._admin_panel)
 
-        # Обработчик возврата в админ панель
-        self.router.callback_query(F.data == "back_to_admin")(self._back_to_admin_panel)
-        self.router.callback_query(F.data == "cancel_operation")(self._cancel_operation)
+        # Таблицы маршрутизации callback: точное совпадение и префиксы (проверяются по порядку)
+        self._callback_exact: dict[str, CallableObject] = {}
+        self._callback_prefixes: list[tuple[str, CallableObject]] = []
+
+        for kind, key, getter in self._ROUTES:
+            if kind == "exact":
+                self._add_callback(getter(self), key)
+            else:
+                self._add_callback(getter(self), prefix=key)
 
-        # Обработчики по работе с пользователями
+        # Обработчики ввода по работе с пользователями
         self._users_manager_handlers()
-        #Обработчики по работе с игроками
+        # Обработчики ввода по работе с игроками
         self._players_manager_handlers()
 
+        # Точные команды проверяются одним фильтром по множеству, префиксы - фильтром с поиском по таблице
+        self.router.callback_query(F.data.in_(frozenset(self._callback_exact)))(self._dispatch_exact_callback)
+        self.router.callback_query(self._resolve_callback)(self._dispatch_callback)
+
         self.logger.info("Обработчики AdminRouter успешно зарегистрированы")
 
+    def _add_callback(self, handler: Callable[..., Any], data: str = None, prefix: str = None) -> None:
+        """
+        Добавляет обработчик callback в таблицы маршрутизации
+
+        :param handler: Обработчик callback
+        :param data: Точное значение callback_data
+        :param prefix: Префикс callback_data
+        """
+        callable_object = CallableObject(handler)
+        if data is not None:
+            self._callback_exact[data] = callable_object
+        if prefix is not None:
+            self._callback_prefixes.append((prefix, callable_object))
+
+    def _resolve_callback(self, callback: CallbackQuery) -> dict[str, CallableObject] | bool:
+        """
+        Фильтр: находит обработчик callback админ-панели по префиксу callback_data
+
+        :param callback: Callback запрос
+        :return: Найденный обработчик для передачи в _dispatch_callback или False
+        """
+        data = callback.data
+        if data is None:
+            return False
+
+        for prefix, handler in self._callback_prefixes:
+            if data.startswith(prefix):
+                return {"admin_handler": handler}
+        return False
+
+    async def _dispatch_exact_callback(self, callback: CallbackQuery, **kwargs: Any) -> Any:
+        """
+        Вызывает обработчик callback с точным совпадением callback_data
+
+        :param callback: Callback запрос
+        """
+        return await self._callback_exact[callback.data].call(callback, **kwargs)
+
+    @staticmethod
+    async def _dispatch_callback(callback: CallbackQuery, admin_handler: CallableObject, **kwargs: Any) -> Any:
+        """
+        Вызывает обработчик, найденный фильтром _resolve_callback.
+        Обработчик получает только те аргументы, которые объявлены в его сигнатуре
+
+        :param callback: Callback запрос
+        :param admin_handler: Обработчик callback
+        """
+        return await admin_handler.call(callback, **kwargs)
+
     async def _admin_panel(self, target: Message | CallbackQuery) -> None:
         """
         Панель администратора - ЕДИНСТВЕННАЯ точка входа, проверяющая права
@@ -88,22 +183,27 @@ class AdminRouter(BaseRouter):
 
         if not await self._is_admin(user_id):
             await message.answer(self.locale.bot.get("access_denied_msg"))
-            self.logger.warning(f"Попытка доступа к админ-панели от не-админа: {user_id}")
+            self.logger.warning("Попытка доступа к админ-панели от не-админа: %s", user_id)
             return
 
-        self.logger.info(f"Админ {user_id} вызвал панель администратора")
+        self.logger.info("Админ %s вызвал панель администратора", user_id)
+        text = self.locale.ui.get("admin_panel_desc")
+        reply_markup = self.keyboard.admin_main_menu
 
+        # Ошибкой может завершиться только запрос к Bot API
         try:
-            await AdminMessageSender().send_or_edit_message(
+            await AdminMessageSender.send_or_edit_message(
                 target=target,
-                text=self.locale.ui.get("admin_panel_desc"),
-                reply_markup=self.keyboard.admin_main_menu
+                text=text,
+                reply_markup=reply_markup,
+                parse_mode=ParseMode.MARKDOWN
             )
-            self.logger.debug(f"Панель администратора отправлена пользователю {user_id}")
-
         except Exception as e:
-            self.logger.error(f"Ошибка при отображении панели администратора: {str(e)}", exc_info=True)
+            self.logger.error("Ошибка при отображении панели администратора: %s", e, exc_info=True)
             await message.answer(self.locale.bot.get("error_display_admin_panel"))
+            return
+
+        self.logger.debug("Панель администратора отправлена пользователю %s", user_id)
 
     async def _back_to_admin_panel(self, callback: CallbackQuery, state: FSMContext) -> None:
         """
@@ -112,61 +212,50 @@ class AdminRouter(BaseRouter):
         :param callback: Callback запрос от кнопки
         :param state: Состояние FSM
         """
-        self.logger.info(f"Админ {callback.from_user.id} нажал 'Назад в админ-панель'")
+        self.logger.info("Админ %s нажал 'Назад в админ-панель'", callback.from_user.id)
         await state.clear()
-        await self._admin_panel(callback)
-        await callback.answer()
+        # Ответ на callback не зависит от отрисовки панели, поэтому запросы к Bot API идут параллельно.
+        # Права проверяются заново: callback_data может прийти из старого сообщения или от стороннего клиента
+        await asyncio.gather(self._admin_panel(callback), callback.answer())
 
     async def _cancel_operation(self, callback: CallbackQuery, state: FSMContext) -> None:
         """
         Отмена операции
         """
-        self.logger.info(f"Админ {callback.from_user.id} отменил операцию")
+        self.logger.info("Админ %s отменил операцию", callback.from_user.id)
+
+        await state.clear()
+        self.logger.debug("Состояние очищено для админа %s", callback.from_user.id)
 
+        # На callback можно ответить только один раз, поэтому ответ отправляется после результата редактирования
         try:
-            await state.clear()
             await callback.message.edit_text("❌ Операция отменена.")
-            await callback.answer()
-            self.logger.debug(f"Состояние очищено для админа {callback.from_user.id}")
-
         except Exception as e:
-            self.logger.error(f"Ошибка при отмене операции: {str(e)}", exc_info=True)
-            await callback.answer("❌ Ошибка при отмене операции.")\
+            self.logger.error("Ошибка при отмене операции: %s", e, exc_info=True)
+            await callback.answer("❌ Ошибка при отмене операции.")
+            return
 
+        await callback.answer()
 
     def _users_manager_handlers(self) -> None:
         """
-        Обработчики по работе с users
+        Обработчики ввода по работе с users
         """
-        self.router.callback_query(F.data == "manage_users_cmd")(self.user_manager.manage_users_panel)
         self.router.message(AdminStates.waiting_for_user_input)(self.user_manager.process_user_input)
-        self.router.callback_query(F.data == "add_user_cmd")(self.user_manager.add_user_callback)
-        self.router.callback_query(F.data == "users_list_cmd")(self.user_manager.users_list_callback)
-        self.router.callback_query(F.data == "delete_users_cmd")(self.user_manager.delete_users_callback)
-        self.router.callback_query(F.data.startswith("role_"))(self.user_manager.process_role_callback)
-        self.router.callback_query(F.data.startswith("delete_user_"))(self.user_manager.delete_user_callback)
-        self.router.callback_query(F.data.startswith("confirm_delete_user_"))(self.user_manager.confirm_delete_callback)
-        self.router.callback_query(F.data.startswith("cancel_delete_user"))(self.user_manager.cancel_delete_callback)
 
     def _players_manager_handlers(self) -> None:
         """
-        Обработчики по работе с игроками
-        """
-        self.router.callback_query(F.data == "manage_players_cmd")(self.players_manager.manage_players_panel)
-        self.router.callback_query(F.data == "add_player_cmd")(self.players_manager.add_player_callback)
-        self.router.callback_query(F.data == "players_list_cmd")(self.players_manager.players_list_callback)
-        self.router.callback_query(F.data == "delete_players_cmd")(self.players_manager.delete_players_callback)
-        self.router.callback_query(F.data == "cancel_player_operation")(self.players_manager.cancel_operation)
-        self.router.callback_query(F.data.startswith("delete_player_"))(self.players_manager.delete_player_callback)
-        self.router.callback_query(F.data.startswith("confirm_delete_player_"))(self.players_manager.confirm_delete_player_callback)
-        self.router.callback_query(F.data == "cancel_delete_player")(self.players_manager.cancel_delete_player_callback)
-        self.router.callback_query(F.data == "skip_photo")(self.players_manager.skip_photo_callback)
-        self.router.callback_query(F.data == "skip_nickname")(self.players_manager.skip_nickname_callback)
-        self.router.callback_query(F.data == "update_levels_cmd")(self.players_manager.update_all_levels_callback)
-
-        self.router.message(AdminStates.waiting_for_player_nickname)(self.players_manager.process_player_nickname_input)
-        self.router.message(AdminStates.waiting_for_player_name)(self.players_manager.process_player_name_input)
-        self.router.message(AdminStates.waiting_for_player_photo)(self.players_manager.process_player_photo_input)
-        self.router.message(AdminStates.waiting_for_player_games)(self.players_manager.process_player_games_input)
+        Обработчики ввода по работе с игроками
+        """
+        # Шаги добавления игрока: состояние FSM -> обработчик ввода
+        register_message = self.router.message
+        players_manager = self.players_manager
+        for state, handler in (
+                (AdminStates.waiting_for_player_nickname, players_manager.process_player_nickname_input),
+                (AdminStates.waiting_for_player_name, players_manager.process_player_name_input),
+                (AdminStates.waiting_for_player_photo, players_manager.process_player_photo_input),
+                (AdminStates.waiting_for_player_games, players_manager.process_player_games_input),
+        ):
+            register_message(state)(handler)
 
 
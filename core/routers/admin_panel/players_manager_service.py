@@ -1,9 +1,11 @@
-import tempfile
+import asyncio
+import time
+from io import BytesIO
 
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
 
-from core.database_manager.db_players_handler import DatabaseQuizPlayerHandler
+from core.database_manager.db_players_handler import DatabaseQuizPlayerHandler, QuizPlayer
 from core.locale.locale import Locale
 from core.routers.admin_panel import AdminMessageSender, AdminKeyboardBuilder, AdminStates
 from errors import ErrorCode
@@ -12,8 +14,21 @@ from logger import Logger
 
 class PlayersManagerService:
     """
-    Сервис управления игроками
+    Сервис управления игроками.
+    Обработчики почти все время ждут ответов Telegram и БД, поэтому бот запускается
+    в цикле событий uvloop, если он доступен (см. app/run.py)
     """
+    # Время жизни закэшированного списка игроков (секунды)
+    PLAYERS_CACHE_TTL = 30.0
+    # Количество игроков на одной странице списка (страница должна укладываться в лимит длины сообщения)
+    PLAYERS_PAGE_SIZE = 20
+    # Текстовые описания кодов ошибок
+    _ERROR_MESSAGES: dict[ErrorCode, str] = {
+        ErrorCode.USER_ALREADY_EXISTS: "Игрок с таким именем и фамилией уже существует",
+        ErrorCode.INVALID_INPUT: "Некорректные входные данные",
+        ErrorCode.DATABASE_ERROR: "Ошибка базы данных",
+        ErrorCode.USER_NOT_FOUND: "Игрок не найден",
+    }
 
     def __init__(self, players_handler: DatabaseQuizPlayerHandler, keyboard: AdminKeyboardBuilder):
         """
@@ -26,6 +41,54 @@ class PlayersManagerService:
         self.logger = Logger().get_logger()
         self.keyboard = keyboard
         self.players_handler = players_handler
+        # Отправка сообщений статична, экземпляр отправителя не создается
+        self._sender = AdminMessageSender
+        # Клавиатура отмены добавления игрока (одинакова для всех шагов)
+        self._cancel_kb = self.keyboard.create_single_button(
+            text=self.locale.buttons.get("btn_cancel"),
+            callback_data="cancel_operation"
+        )
+        # Кэш списка игроков: (момент загрузки, игроки)
+        self._players_cache: tuple[float, list[QuizPlayer]] | None = None
+        # Игроки из закэшированного списка по ID (для подтверждения удаления из меню)
+        self._players_by_id: dict[int, QuizPlayer] = {}
+
+    async def _get_players_cached(self) -> list[QuizPlayer]:
+        """
+        Возвращает список всех игроков, повторные запросы в течение PLAYERS_CACHE_TTL обслуживаются из памяти
+
+        :return: Список игроков
+        """
+        now = time.monotonic()
+        cached = self._players_cache
+        if cached is not None and now - cached[0] < self.PLAYERS_CACHE_TTL:
+            return cached[1]
+
+        players = await self.players_handler.get_all_players()
+        self._players_cache = (now, players)
+        self._players_by_id = {player.player_id: player for player in players}
+        return players
+
+    async def _get_player(self, player_id: int) -> QuizPlayer | None:
+        """
+        Возвращает игрока из закэшированного списка, при промахе - из БД
+
+        :param player_id: ID игрока
+        :return: Игрок или None, если не найден
+        """
+        cached = self._players_cache
+        if cached is not None and time.monotonic() - cached[0] < self.PLAYERS_CACHE_TTL:
+            player = self._players_by_id.get(player_id)
+            if player is not None:
+                return player
+        return await self.players_handler.get_player(player_id)
+
+    def _invalidate_players_cache(self) -> None:
+        """
+        Сбрасывает кэш списка игроков (после изменения игроков в БД)
+        """
+        self._players_cache = None
+        self._players_by_id = {}
 
     async def manage_players_panel(self, callback: CallbackQuery, state: FSMContext) -> None:
         """
@@ -38,7 +101,7 @@ class PlayersManagerService:
         await state.clear()
 
         try:
-            await AdminMessageSender().send_or_edit_message(
+            await self._sender.send_or_edit_message(
                 target=callback,
                 text=self.locale.ui.get("admin_players_management_desc"),
                 reply_markup=self.keyboard.admin_players_management_menu
@@ -58,19 +121,16 @@ class PlayersManagerService:
         """
         self.logger.info(f"Админ {callback.from_user.id} начал добавление игрока")
 
-        try:
-            await state.set_state(AdminStates.waiting_for_player_name)
-            await state.update_data(player_data={})
+        await state.set_state(AdminStates.waiting_for_player_name)
+        await state.update_data(player_data={})
 
-            await AdminMessageSender().send_or_edit_message(
+        # Ошибкой может завершиться только запрос к Bot API
+        try:
+            await self._sender.send_or_edit_message(
                 target=callback,
                 text=self.locale.ui.get("admin_add_player_name_desc"),
-                reply_markup=self.keyboard.create_single_button(
-                    text=self.locale.buttons.get("btn_cancel"),
-                    callback_data="cancel_operation"
-                )
+                reply_markup=self._cancel_kb
             )
-
         except Exception as e:
             self.logger.error(f"Ошибка при начале добавления игрока: {str(e)}")
             await callback.message.answer(self.locale.bot.get("error_operation"))
@@ -86,44 +146,37 @@ class PlayersManagerService:
         """
         name_input = message.text.strip()
 
-        try:
-            # Проверяем формат ввода (должны быть имя и фамилия)
-            name_parts = name_input.split()
-            if len(name_parts) < 2:
-                await message.answer(
-                    self.locale.bot.get("admin_player_name_format_error"),
-                    reply_markup=self.keyboard.create_single_button(
-                        text=self.locale.buttons.get("btn_cancel"),
-                        callback_data="cancel_operation"
-                    )
-                )
-                return
-
-            first_name = name_parts[0]
-            last_name = ' '.join(name_parts[1:])
-
-            # Сохраняем в состоянии
-            await state.update_data(
-                player_first_name=first_name,
-                player_last_name=last_name
+        # Проверяем формат ввода (должны быть имя и фамилия)
+        name_parts = name_input.split(None, 1)
+        if len(name_parts) < 2:
+            await message.answer(
+                self.locale.bot.get("admin_player_name_format_error"),
+                reply_markup=self._cancel_kb
             )
+            return
+
+        # Все после первого слова считается фамилией
+        first_name, last_name = name_parts
 
-            # УСТАНАВЛИВАЕМ СОСТОЯНИЕ ДЛЯ НИКНЕЙМА
-            await state.set_state(AdminStates.waiting_for_player_nickname)
+        # Сохраняем в состоянии
+        await state.update_data(
+            player_first_name=first_name,
+            player_last_name=last_name
+        )
 
+        # УСТАНАВЛИВАЕМ СОСТОЯНИЕ ДЛЯ НИКНЕЙМА
+        await state.set_state(AdminStates.waiting_for_player_nickname)
+
+        try:
             await message.answer(
                 text=self.locale.ui.get("admin_add_player_nickname_desc"),
                 reply_markup=self.keyboard.nickname_skip_keyboard
             )
-
         except Exception as e:
             self.logger.error(f"Ошибка при обработке имени игрока: {str(e)}")
             await message.answer(
                 self.locale.bot.get("error_operation"),
-                reply_markup=self.keyboard.create_single_button(
-                    text=self.locale.buttons.get("btn_cancel"),
-                    callback_data="cancel_operation"
-                )
+                reply_markup=self._cancel_kb
             )
 
     async def process_player_nickname_input(self, message: Message, state: FSMContext) -> None:
@@ -135,26 +188,22 @@ class PlayersManagerService:
         """
         nickname_input = message.text.strip()
 
-        try:
-            # Сохраняем никнейм в состоянии
-            await state.update_data(player_nickname=nickname_input)
+        # Сохраняем никнейм в состоянии
+        await state.update_data(player_nickname=nickname_input)
 
-            # Переходим к запросу фото
-            await state.set_state(AdminStates.waiting_for_player_photo)
+        # Переходим к запросу фото
+        await state.set_state(AdminStates.waiting_for_player_photo)
 
+        try:
             await message.answer(
                 self.locale.ui.get("admin_add_player_photo_desc"),
                 reply_markup=self.keyboard.photo_upload_keyboard
             )
-
         except Exception as e:
             self.logger.error(f"Ошибка при обработке никнейма игрока: {str(e)}")
             await message.answer(
                 self.locale.bot.get("error_operation"),
-                reply_markup=self.keyboard.create_single_button(
-                    text=self.locale.buttons.get("btn_cancel"),
-                    callback_data="cancel_operation"
-                )
+                reply_markup=self._cancel_kb
             )
 
     async def skip_nickname_callback(self, callback: CallbackQuery, state: FSMContext) -> None:
@@ -166,23 +215,24 @@ class PlayersManagerService:
         """
         self.logger.info(f"Админ {callback.from_user.id} пропустил ввод никнейма")
 
-        try:
-            # Сохраняем None для никнейма
-            await state.update_data(player_nickname=None)
+        # Сохраняем None для никнейма
+        await state.update_data(player_nickname=None)
 
-            # Переходим к запросу фото
-            await state.set_state(AdminStates.waiting_for_player_photo)
+        # Переходим к запросу фото
+        await state.set_state(AdminStates.waiting_for_player_photo)
 
-            await AdminMessageSender().send_or_edit_message(
+        try:
+            await self._sender.send_or_edit_message(
                 target=callback,
                 text=self.locale.ui.get("admin_add_player_photo_desc"),
                 reply_markup=self.keyboard.photo_upload_keyboard
             )
-            await callback.answer("✅ Ввод никнейма пропущен")
-
         except Exception as e:
             self.logger.error(f"Ошибка при пропуске никнейма: {str(e)}")
             await callback.answer("❌ Ошибка при пропуске никнейма")
+            return
+
+        await callback.answer("✅ Ввод никнейма пропущен")
 
     async def process_player_photo_input(self, message: Message, state: FSMContext) -> None:
         """
@@ -191,43 +241,35 @@ class PlayersManagerService:
         :param message: Сообщение с фото
         :param state: Состояние FSM
         """
+        if not message.photo:
+            await message.answer(
+                self.locale.ui.get("admin_player_photo_error"),
+                reply_markup=self._cancel_kb
+            )
+            return
+
+        # Получаем самое большое фото
+        photo = message.photo[-1]
+
+        # Ошибкой могут завершиться только запросы к Bot API
         try:
-            if not message.photo:
-                await message.answer(
-                    self.locale.ui.get("admin_player_photo_error"),
-                    reply_markup=self.keyboard.create_single_button(
-                        text=self.locale.buttons.get("btn_cancel"),
-                        callback_data="cancel_operation"
-                    )
-                )
-                return
-
-            # Получаем самое большое фото
-            photo = message.photo[-1]
             photo_file = await message.bot.get_file(photo.file_id)
 
-            # Сохраняем информацию о фото
-            await state.update_data(player_photo_file_id=photo_file.file_id)
+            # Сохраняем информацию о фото (путь к файлу нужен для скачивания без повторного get_file)
+            await state.update_data(player_photo_file_id=photo.file_id, player_photo_file_path=photo_file.file_path)
 
             # Переходим к запросу количества игр
             await state.set_state(AdminStates.waiting_for_player_games)
 
             await message.answer(
                 self.locale.ui.get("admin_add_player_games_desc"),
-                reply_markup=self.keyboard.create_single_button(
-                    text=self.locale.buttons.get("btn_cancel"),
-                    callback_data="cancel_operation"
-                )
+                reply_markup=self._cancel_kb
             )
-
         except Exception as e:
             self.logger.error(f"Ошибка при обработке фото игрока: {str(e)}")
             await message.answer(
                 self.locale.bot.get("error_operation"),
-                reply_markup=self.keyboard.create_single_button(
-                    text=self.locale.buttons.get("btn_cancel"),
-                    callback_data="cancel_operation"
-                )
+                reply_markup=self._cancel_kb
             )
 
     async def skip_photo_callback(self, callback: CallbackQuery, state: FSMContext) -> None:
@@ -239,26 +281,24 @@ class PlayersManagerService:
         """
         self.logger.info(f"Админ {callback.from_user.id} пропустил загрузку фото")
 
-        try:
-            # Сохраняем None для фото
-            await state.update_data(player_photo_file_id=None)
+        # Сохраняем None для фото
+        await state.update_data(player_photo_file_id=None, player_photo_file_path=None)
 
-            # Переходим к запросу количества игр
-            await state.set_state(AdminStates.waiting_for_player_games)
+        # Переходим к запросу количества игр
+        await state.set_state(AdminStates.waiting_for_player_games)
 
-            await AdminMessageSender().send_or_edit_message(
+        try:
+            await self._sender.send_or_edit_message(
                 target=callback,
                 text=self.locale.ui.get("admin_add_player_games_desc"),
-                reply_markup=self.keyboard.create_single_button(
-                    text=self.locale.buttons.get("btn_cancel"),
-                    callback_data="cancel_operation"
-                )
+                reply_markup=self._cancel_kb
             )
-            await callback.answer("✅ Загрузка фото пропущена")
-
         except Exception as e:
             self.logger.error(f"Ошибка при пропуске фото: {str(e)}")
             await callback.answer("❌ Ошибка при пропуске фото")
+            return
+
+        await callback.answer("✅ Загрузка фото пропущена")
 
     async def process_player_games_input(self, message: Message, state: FSMContext) -> None:
         """
@@ -269,125 +309,114 @@ class PlayersManagerService:
         """
         games_input = message.text.strip()
 
+        # Проверяем, что введено число
         try:
-            # Проверяем, что введено число
-            try:
-                games_played = int(games_input)
-                if games_played < 0:
-                    raise ValueError("Отрицательное число")
-            except ValueError:
-                await message.answer(
-                    self.locale.ui.get("admin_player_games_format_error"),
-                    reply_markup=self.keyboard.create_single_button(
-                        text=self.locale.buttons.get("btn_cancel"),
-                        callback_data="cancel_operation"
-                    )
-                )
-                return
-
-            # Получаем данные из состояния
-            state_data = await state.get_data()
-            first_name = state_data.get('player_first_name')
-            last_name = state_data.get('player_last_name')
-            nickname = state_data.get('player_nickname')
-            photo_file_id = state_data.get('player_photo_file_id')
-
-            if not first_name or not last_name:
-                await message.answer(
-                    self.locale.bot.get("error_operation"),
-                    reply_markup=self.keyboard.create_single_button(
-                        text=self.locale.buttons.get("btn_cancel"),
-                        callback_data="cancel_operation"
-                    )
-                )
-                await state.clear()
-                return
-
-            # Рассчитываем уровни на основе количества игр
-            level = await self.players_handler.calculate_level_from_games(games_played)
-            rank_player = await self.players_handler.calculate_rank_player_from_games(games_played)
-
-            self.logger.info(f"Рассчитаны уровни для игрока: games={games_played}, "
-                           f"level={level}, rank_player={rank_player}")
-
-            # Сохраняем фото во временный файл
-            photo_path = None
-            if photo_file_id:
-                photo_path = await self._download_photo(message.bot, photo_file_id, first_name, last_name)
-
-            # Добавляем игрока в базу
-            result = await self.players_handler.add_player(
+            games_played = int(games_input)
+            if games_played < 0:
+                raise ValueError("Отрицательное число")
+        except ValueError:
+            await message.answer(
+                self.locale.ui.get("admin_player_games_format_error"),
+                reply_markup=self._cancel_kb
+            )
+            return
+
+        # Получаем данные из состояния
+        state_data = await state.get_data()
+        first_name = state_data.get('player_first_name')
+        last_name = state_data.get('player_last_name')
+        nickname = state_data.get('player_nickname')
+        photo_file_id = state_data.get('player_photo_file_id')
+        photo_file_path = state_data.get('player_photo_file_path')
+
+        if not first_name or not last_name:
+            await message.answer(
+                self.locale.bot.get("error_operation"),
+                reply_markup=self._cancel_kb
+            )
+            await state.clear()
+            return
+
+        # Скачивание фото не зависит от расчета уровней, поэтому запускается сразу
+        photo_task = None
+        if photo_file_id:
+            photo_task = asyncio.create_task(
+                self._download_photo(message.bot, photo_file_id, file_path=photo_file_path)
+            )
+
+        # Рассчитываем уровни на основе количества игр
+        level = self.players_handler.calculate_level_from_games(games_played)
+        rank_player = self.players_handler.calculate_rank_player_from_games(games_played)
+
+        self.logger.info(f"Рассчитаны уровни для игрока: games={games_played}, "
+                         f"level={level}, rank_player={rank_player}")
+
+        # Дожидаемся скачивания фото
+        photo_bytes = await photo_task if photo_task is not None else None
+
+        # Добавляем игрока в базу (ошибки БД возвращаются кодом результата)
+        result = await self.players_handler.add_player(
+            first_name=first_name,
+            last_name=last_name,
+            nickname=nickname,
+            photo_bytes=photo_bytes,
+            games_played=games_played,
+            rank_player=rank_player,
+            level=level
+        )
+
+        # Очищаем состояние
+        await state.clear()
+
+        # Формируем результат
+        if result == ErrorCode.SUCCESSFUL:
+            self._invalidate_players_cache()
+            text = self.locale.ui.render(
+                "admin_player_add_success",
                 first_name=first_name,
                 last_name=last_name,
-                nickname=nickname,
-                photo_path=photo_path,
+                nickname=f"\n🏷️ Никнейм: {nickname}" if nickname else "",
                 games_played=games_played,
                 rank_player=rank_player,
                 level=level
             )
+            self.logger.info(f"Игрок {first_name} {last_name} успешно добавлен")
+        else:
+            error_msg = self._get_error_message(result)
+            text = self.locale.bot.render("admin_player_add_error", error=error_msg)
+            self.logger.error(f"Ошибка добавления игрока: {error_msg}")
 
-            # Очищаем состояние
-            await state.clear()
-
-            # Отправляем результат
-            if result == ErrorCode.SUCCESSFUL:
-                text = self.locale.ui.get("admin_player_add_success").format(
-                        first_name=first_name,
-                        last_name=last_name,
-                        nickname=f"\n🏷️ Никнейм: {nickname}" if nickname else "",
-                        games_played=games_played,
-                        rank_player=rank_player,
-                        level=level
-                    )
-                await message.answer(
-                    text=text,
-                    reply_markup=self.keyboard.back_to_players_management_keyboard
-                )
-                self.logger.info(f"Игрок {first_name} {last_name} успешно добавлен")
-            else:
-                error_msg = self._get_error_message(result)
-                await message.answer(
-                    self.locale.bot.get("admin_player_add_error").format(error=error_msg),
-                    reply_markup=self.keyboard.back_to_players_management_keyboard
-                )
-                self.logger.error(f"Ошибка добавления игрока: {error_msg}")
-
+        try:
+            await message.answer(
+                text=text,
+                reply_markup=self.keyboard.back_to_players_management_keyboard
+            )
         except Exception as e:
             self.logger.error(f"Ошибка при обработке количества игр: {str(e)}")
             await message.answer(
                 self.locale.bot.get("error_operation"),
                 reply_markup=self.keyboard.back_to_players_management_keyboard
             )
-            await state.clear()
 
-    async def _download_photo(self, bot, file_id: str, first_name: str, last_name: str) -> str | None:
+    async def _download_photo(self, bot, file_id: str, file_path: str | None = None) -> bytes | None:
         """
-        Скачивает фото и сохраняет во временный файл
+        Скачивает фото в память
 
         :param bot: Бот для скачивания
         :param file_id: ID файла в Telegram
-        :param first_name: Имя игрока
-        :param last_name: Фамилия игрока
-        :return: Путь к сохраненному файлу
+        :param file_path: Путь к файлу на серверах Telegram, полученный при загрузке фото.
+            Если не передан, запрашивается через get_file
+        :return: Содержимое фото
         """
         try:
-            # Создаем временный файл
-            safe_first_name = "".join(c for c in first_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_last_name = "".join(c for c in last_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            if file_path is None:
+                file_path = (await bot.get_file(file_id)).file_path
 
-            with tempfile.NamedTemporaryFile(
-                    suffix='.jpg',
-                    prefix=f'{safe_first_name}_{safe_last_name}_',
-                    delete=False
-            ) as temp_file:
-                temp_path = temp_file.name
+            buffer = BytesIO()
+            await bot.download_file(file_path, destination=buffer)
 
-            # Скачиваем файл
-            file = await bot.get_file(file_id)
-            await bot.download_file(file.file_path, temp_path)
-
-            self.logger.info(f"Фото сохранено во временный файл: {temp_path}")
-            return temp_path
+            self.logger.info(f"Фото скачано: {buffer.tell()} байт")
+            return buffer.getvalue()
 
         except Exception as e:
             self.logger.error(f"Ошибка при скачивании фото: {str(e)}")
@@ -400,41 +429,40 @@ class PlayersManagerService:
         :param error_code: Код ошибки
         :return: Текстовое описание
         """
-        error_messages = {
-            ErrorCode.USER_ALREADY_EXISTS: "Игрок с таким именем и фамилией уже существует",
-            ErrorCode.INVALID_INPUT: "Некорректные входные данные",
-            ErrorCode.DATABASE_ERROR: "Ошибка базы данных",
-            ErrorCode.USER_NOT_FOUND: "Игрок не найден",
-        }
-        return error_messages.get(error_code, "Неизвестная ошибка")
+        return self._ERROR_MESSAGES.get(error_code, "Неизвестная ошибка")
 
     async def players_list_callback(self, callback: CallbackQuery, state: FSMContext) -> None:
         """
-        Обработчик кнопки списка игроков
+        Обработчик кнопки списка игроков и переключения его страниц (players_list_page_N)
 
         :param callback: Callback запрос от кнопки
         :param state: Состояние FSM
         """
-        self.logger.info(f"Админ {callback.from_user.id} запросил список игроков")
+        try:
+            page = int(callback.data.replace("players_list_page_", ""))
+        except ValueError:
+            page = 0
+        self.logger.info(f"Админ {callback.from_user.id} запросил список игроков, страница {page}")
         await state.clear()
 
-        try:
-            players = await self.players_handler.get_all_players()
-
-            if not players:
-                await AdminMessageSender().send_or_edit_message(
-                    target=callback,
-                    text=self.locale.bot.get("admin_no_players_found"),
-                    reply_markup=self.keyboard.back_to_players_management_keyboard
-                )
-            else:
-                players_text = self._format_players_list(players)
-                await AdminMessageSender().send_or_edit_message(
-                    target=callback,
-                    text=players_text,
-                    reply_markup=self.keyboard.back_to_players_management_keyboard
-                )
+        players = await self._get_players_cached()
+        page_size = self.PLAYERS_PAGE_SIZE
+        pages = max(1, -(-len(players) // page_size))
+        # Список мог сократиться с момента отправки кнопки
+        page = min(max(page, 0), pages - 1)
+        start = page * page_size
 
+        # _format_players_list сам возвращает текст для пустого списка
+        players_text = self._format_players_list(players[start:start + page_size], start=start + 1)
+        if pages > 1:
+            players_text += f"\n\nСтраница {page + 1} из {pages}"
+
+        try:
+            await self._sender.send_or_edit_message(
+                target=callback,
+                text=players_text,
+                reply_markup=self.keyboard.players_list_page_keyboard(page, pages)
+            )
         except Exception as e:
             self.logger.error(f"Ошибка при получении списка игроков: {str(e)}")
             await callback.message.answer(
@@ -444,21 +472,24 @@ class PlayersManagerService:
 
         await callback.answer()
 
-    def _format_players_list(self, players: list) -> str:
+    def _format_players_list(self, players: list, start: int = 1) -> str:
         """
         Форматирует список игроков для отображения
 
         :param players: Список игроков
+        :param start: Порядковый номер первого игрока в списке
         :return: Отформатированный текст
         """
         if not players:
             return self.locale.bot.get("admin_no_players_found")
 
-        header = self.locale.ui.get("admin_players_list_header") + "\n\n"
-        players_text = []
+        ui = self.locale.ui
+        header = ui.get("admin_players_list_header") + "\n\n"
+        render = ui.render
 
-        for i, player in enumerate(players, 1):
-            player_stat = self.locale.ui.get("user_statistics_desc").format(
+        return header + "\n".join(
+            render(
+                "user_statistics_desc",
                 id=i,
                 first_name=player.first_name,
                 last_name=player.last_name,
@@ -467,9 +498,8 @@ class PlayersManagerService:
                 rank_player=player.rank_player,
                 level=player.level
             )
-            players_text.append(player_stat)
-
-        return header + "\n".join(players_text)
+            for i, player in enumerate(players, start)
+        )
 
     async def delete_players_callback(self, callback: CallbackQuery, state: FSMContext) -> None:
         """
@@ -481,23 +511,20 @@ class PlayersManagerService:
         self.logger.info(f"Админ {callback.from_user.id} открыл меню удаления игроков")
         await state.clear()
 
-        try:
-            players = await self.players_handler.get_all_players()
-
-            if not players:
-                await AdminMessageSender().send_or_edit_message(
-                    target=callback,
-                    text=self.locale.bot.get("admin_no_players_found"),
-                    reply_markup=self.keyboard.back_to_players_management_keyboard
-                )
-            else:
-                players_text = self.locale.ui.get("admin_delete_players_header")
-                await AdminMessageSender().send_or_edit_message(
-                    target=callback,
-                    text=players_text,
-                    reply_markup=self.keyboard.players_delete_keyboard(players)
-                )
+        players = await self._get_players_cached()
+        if not players:
+            text = self.locale.bot.get("admin_no_players_found")
+            reply_markup = self.keyboard.back_to_players_management_keyboard
+        else:
+            text = self.locale.ui.get("admin_delete_players_header")
+            reply_markup = self.keyboard.players_delete_keyboard(players)
 
+        try:
+            await self._sender.send_or_edit_message(
+                target=callback,
+                text=text,
+                reply_markup=reply_markup
+            )
         except Exception as e:
             self.logger.error(f"Ошибка при получении списка игроков для удаления: {str(e)}")
             await callback.message.answer(
@@ -515,28 +542,36 @@ class PlayersManagerService:
         """
         try:
             player_id = int(callback.data.replace("delete_player_", ""))
-            self.logger.info(f"Админ {callback.from_user.id} запросил удаление игрока {player_id}")
+        except ValueError:
+            self.logger.error(f"Некорректный ID игрока в callback: {callback.data}")
+            await callback.answer(self.locale.bot.get("error_operation"), show_alert=True)
+            return
 
-            player = await self.players_handler.get_player(player_id)
-            if not player:
-                await callback.answer(self.locale.bot.get("admin_player_not_found"), show_alert=True)
-                return
+        self.logger.info(f"Админ {callback.from_user.id} запросил удаление игрока {player_id}")
 
-            # Показываем подтверждение удаления
-            confirmation_text = self.locale.ui.get("admin_confirm_delete_player").format(
-                first_name=player.first_name,
-                last_name=player.last_name
-            )
+        player = await self._get_player(player_id)
+        if not player:
+            await callback.answer(self.locale.bot.get("admin_player_not_found"), show_alert=True)
+            return
+
+        # Показываем подтверждение удаления
+        confirmation_text = self.locale.ui.render(
+            "admin_confirm_delete_player",
+            first_name=player.first_name,
+            last_name=player.last_name
+        )
 
-            await AdminMessageSender().send_or_edit_message(
+        try:
+            await self._sender.send_or_edit_message(
                 target=callback,
                 text=confirmation_text,
                 reply_markup=self.keyboard.confirm_delete_player_keyboard(player_id)
             )
-
         except Exception as e:
             self.logger.error(f"Ошибка при обработке удаления игрока: {str(e)}")
+            # На callback можно ответить только один раз
             await callback.answer(self.locale.bot.get("error_operation"), show_alert=True)
+            return
 
         await callback.answer()
 
@@ -548,30 +583,36 @@ class PlayersManagerService:
         """
         try:
             player_id = int(callback.data.replace("confirm_delete_player_", ""))
-            self.logger.info(f"Админ {callback.from_user.id} подтвердил удаление игрока {player_id}")
-
-            # Удаляем игрока
-            result = await self.players_handler.delete_player(player_id)
-
-            if result == ErrorCode.SUCCESSFUL:
-                await AdminMessageSender().send_or_edit_message(
-                    target=callback,
-                    text=self.locale.ui.get("admin_player_delete_success"),
-                    reply_markup=self.keyboard.back_to_players_management_keyboard
-                )
-                self.logger.info(f"Игрок {player_id} успешно удален")
-            else:
-                error_msg = self._get_error_message(result)
-                await AdminMessageSender().send_or_edit_message(
-                    target=callback,
-                    text=self.locale.bot.get("admin_player_delete_error").format(error=error_msg),
-                    reply_markup=self.keyboard.back_to_players_management_keyboard
-                )
-                self.logger.error(f"Ошибка удаления игрока {player_id}: {error_msg}")
+        except ValueError:
+            self.logger.error(f"Некорректный ID игрока в callback: {callback.data}")
+            await callback.answer(self.locale.bot.get("error_operation"), show_alert=True)
+            return
+
+        self.logger.info(f"Админ {callback.from_user.id} подтвердил удаление игрока {player_id}")
+
+        # Удаляем игрока (ошибки БД возвращаются кодом результата)
+        result = await self.players_handler.delete_player(player_id)
 
+        if result == ErrorCode.SUCCESSFUL:
+            self._invalidate_players_cache()
+            text = self.locale.ui.get("admin_player_delete_success")
+            self.logger.info(f"Игрок {player_id} успешно удален")
+        else:
+            error_msg = self._get_error_message(result)
+            text = self.locale.bot.render("admin_player_delete_error", error=error_msg)
+            self.logger.error(f"Ошибка удаления игрока {player_id}: {error_msg}")
+
+        try:
+            await self._sender.send_or_edit_message(
+                target=callback,
+                text=text,
+                reply_markup=self.keyboard.back_to_players_management_keyboard
+            )
         except Exception as e:
             self.logger.error(f"Ошибка при подтверждении удаления игрока: {str(e)}")
+            # На callback можно ответить только один раз
             await callback.answer(self.locale.bot.get("error_operation"), show_alert=True)
+            return
 
         await callback.answer()
 
@@ -606,37 +647,40 @@ class PlayersManagerService:
         self.logger.info(f"Админ {callback.from_user.id} запустил обновление уровней всех игроков")
         await state.clear()
 
+        # Показываем сообщение о начале процесса. Его ошибка не мешает обновлению
         try:
-            # Показываем сообщение о начале процесса
-            await AdminMessageSender().send_or_edit_message(
+            await self._sender.send_or_edit_message(
                 target=callback,
                 text="🔄 Начинаю обновление уровней всех игроков..."
             )
-
-            # Запускаем обновление
-            updated_count, error_count = await self.players_handler.update_all_players_levels()
-
-            # Формируем результат
-            if error_count == 0:
-                if updated_count == 0:
-                    text = "✅ У всех игроков уже актуальные уровни и ранги"
-                else:
-                    text = f"✅ Успешно обновлены уровни и ранги для {updated_count} игроков"
+        except Exception as e:
+            self.logger.error(f"Ошибка при отображении начала обновления уровней: {str(e)}")
+
+        # Запускаем обновление (ошибки БД учитываются в error_count)
+        updated_count, error_count = await self.players_handler.update_all_players_levels()
+        if updated_count:
+            self._invalidate_players_cache()
+        self.logger.info(f"Обновление уровней завершено: {updated_count} успешно, {error_count} ошибок")
+
+        # Формируем результат
+        if error_count == 0:
+            if updated_count == 0:
+                text = "✅ У всех игроков уже актуальные уровни и ранги"
             else:
-                text = (
-                    f"⚠️ Обновление завершено с ошибками:\n"
-                    f"• Успешно обновлено: {updated_count}\n"
-                    f"• Ошибок: {error_count}"
-                )
+                text = f"✅ Успешно обновлены уровни и ранги для {updated_count} игроков"
+        else:
+            text = (
+                f"⚠️ Обновление завершено с ошибками:\n"
+                f"• Успешно обновлено: {updated_count}\n"
+                f"• Ошибок: {error_count}"
+            )
 
-            await AdminMessageSender().send_or_edit_message(
+        try:
+            await self._sender.send_or_edit_message(
                 target=callback,
                 text=text,
                 reply_markup=self.keyboard.back_to_players_management_keyboard
             )
-
-            self.logger.info(f"Обновление уровней завершено: {updated_count} успешно, {error_count} ошибок")
-
         except Exception as e:
             self.logger.error(f"Ошибка при обновлении уровней игроков: {str(e)}")
             await callback.message.answer(
@@ -1,3 +1,4 @@
+from aiogram.enums import ParseMode
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
 
@@ -36,10 +37,11 @@ class UsersManagerService:
         await state.clear()
 
         try:
-            await AdminMessageSender().send_or_edit_message(
+            await AdminMessageSender.send_or_edit_message(
                 target=callback,
                 text=self.locale.ui.get("admin_users_management_desc"),
-                reply_markup=self.keyboard.admin_users_management_menu
+                reply_markup=self.keyboard.admin_users_management_menu,
+                parse_mode=ParseMode.MARKDOWN
             )
         except Exception as e:
             self.logger.error(f"Ошибка при отображении панели управления пользователями: {str(e)}")
@@ -58,13 +60,14 @@ class UsersManagerService:
 
         try:
             await state.clear()
-            await AdminMessageSender().send_or_edit_message(
+            await AdminMessageSender.send_or_edit_message(
                 target=callback,
                 text=self.locale.ui.get("add_user_desc"),
                 reply_markup=self.keyboard.create_single_button(
                     text=self.locale.buttons.get("btn_back"),
                     callback_data="back_to_admin"
-                )
+                ),
+                parse_mode=ParseMode.MARKDOWN
             )
 
             await state.set_state(AdminStates.waiting_for_user_input)
@@ -99,13 +102,14 @@ class UsersManagerService:
         self.logger.warning(f"Админ {admin_id} отправил непересланное сообщение: {message.text}")
 
         text = self.locale.bot.get("error_input_forward_msg")
-        await AdminMessageSender().send_or_edit_message(
+        await AdminMessageSender.send_or_edit_message(
             target=message,
             text=text,
             reply_markup=self.keyboard.create_single_button(
                 text=self.locale.buttons.get("btn_back"),
                 callback_data="back_to_admin"
-            )
+            ),
+            parse_mode=ParseMode.MARKDOWN
         )
 
     async def handle_forwarded_message(self, message: Message, state: FSMContext) -> None:
@@ -129,19 +133,21 @@ class UsersManagerService:
                 self.logger.warning(
                     f"Попытка добавить существующего пользователя {user_id} через пересланное сообщение")
 
-                text = self.locale.bot.get("warning_user_is_exists").format(
+                text = self.locale.bot.render(
+                    "warning_user_is_exists",
                     user_id=user_id,
                     username=username if username else "не указан",
                     first_name=first_name,
                     last_name=last_name,
                 )
-                await AdminMessageSender().send_or_edit_message(
+                await AdminMessageSender.send_or_edit_message(
                     target=message,
                     text=text,
                     reply_markup=self.keyboard.create_single_button(
                         text=self.locale.buttons.get("btn_back"),
                         callback_data="back_to_admin"
-                    )
+                    ),
+                    parse_mode=ParseMode.MARKDOWN
                 )
                 return
 
@@ -179,17 +185,19 @@ class UsersManagerService:
         """
         await state.update_data(username=username)
 
-        text = self.locale.ui.get("add_user_data_desc").format(
+        text = self.locale.ui.render(
+            "add_user_data_desc",
             user_id=user_id,
             username=username if username else "не указан",
             first_name=first_name or "",
             last_name=last_name or "",
         )
 
-        await AdminMessageSender().send_or_edit_message(
+        await AdminMessageSender.send_or_edit_message(
             target=message,
             text=text,
-            reply_markup=self.keyboard.role_selection_keyboard
+            reply_markup=self.keyboard.role_selection_keyboard,
+            parse_mode=ParseMode.MARKDOWN
         )
         await state.set_state(AdminStates.waiting_for_role)
         self.logger.debug(f"Установлено состояние waiting_for_role для админа {message.from_user.id}")
@@ -207,21 +215,23 @@ class UsersManagerService:
 
             if not users:
                 text = self.locale.ui.get("delete_users_users_not_found")
-                await AdminMessageSender().send_or_edit_message(
+                await AdminMessageSender.send_or_edit_message(
                     target=callback,
                     text=text,
                     reply_markup=self.keyboard.create_single_button(
                         text=self.locale.buttons.get("btn_back"),
                         callback_data="back_to_admin"
-                    )
+                    ),
+                    parse_mode=ParseMode.MARKDOWN
                 )
                 return
 
             text = self.locale.ui.get("delete_users_desc")
-            await AdminMessageSender().send_or_edit_message(
+            await AdminMessageSender.send_or_edit_message(
                 target=callback,
                 text=text,
-                reply_markup=self.keyboard.create_delete_user_list_keyboard(users)
+                reply_markup=self.keyboard.create_delete_user_list_keyboard(users),
+                parse_mode=ParseMode.MARKDOWN
             )
 
         except Exception as e:
@@ -252,14 +262,16 @@ class UsersManagerService:
 
             await state.update_data(delete_user_id=user_id)
 
-            text = self.locale.ui.get("confirm_delete_desc").format(
+            text = self.locale.ui.render(
+                "confirm_delete_desc",
                 user_id=user_id,
                 user_role=user_role.value
             )
-            await AdminMessageSender().send_or_edit_message(
+            await AdminMessageSender.send_or_edit_message(
                 target=callback,
                 text=text,
-                reply_markup=self.keyboard.confirm_delete_user_keyboard(user_id)
+                reply_markup=self.keyboard.confirm_delete_user_keyboard(user_id),
+                parse_mode=ParseMode.MARKDOWN
             )
             await state.set_state(AdminStates.waiting_for_delete_confirmation)
 
@@ -281,7 +293,7 @@ class UsersManagerService:
 
             user_exists = await self.user_handler.user_exists(user_id)
             if not user_exists:
-                await AdminMessageSender().send_or_edit_message(
+                await AdminMessageSender.send_or_edit_message(
                     target=callback,
                     text=self.locale.bot.get("error_user_not_found"),
                     reply_markup=self.keyboard.create_single_button(
@@ -294,7 +306,7 @@ class UsersManagerService:
 
             user_role = await self.user_handler.get_user_role(user_id)
             if user_role == UserRole.ADMIN:
-                await AdminMessageSender().send_or_edit_message(
+                await AdminMessageSender.send_or_edit_message(
                     target=callback,
                     text=self.locale.bot.get("error_delete_admin"),
                     reply_markup=self.keyboard.create_single_button(
@@ -309,17 +321,19 @@ class UsersManagerService:
             result = await self.user_handler.delete_user(user_id)
 
             if result == ErrorCode.SUCCESSFUL:
-                text = self.locale.ui.get("user_deleted_successful_desc").format(
+                text = self.locale.ui.render(
+                    "user_deleted_successful_desc",
                     user_id=user_id,
                     user_role=user_role.value
                 )
-                await AdminMessageSender().send_or_edit_message(
+                await AdminMessageSender.send_or_edit_message(
                     target=callback,
                     text=text,
                     reply_markup=self.keyboard.create_single_button(
                         text=self.locale.buttons.get("btn_back"),
                         callback_data="back_to_admin"
-                    )
+                    ),
+                    parse_mode=ParseMode.MARKDOWN
                 )
 
                 admin_username = f"@{callback.from_user.username}" if callback.from_user.username else callback.from_user.full_name
@@ -328,25 +342,27 @@ class UsersManagerService:
                     f"удалил пользователя {user_id}"
                 )
             else:
-                await AdminMessageSender().send_or_edit_message(
+                await AdminMessageSender.send_or_edit_message(
                     target=callback,
                     text=self.locale.bot.get("error_delete_user_desc"),
                     reply_markup=self.keyboard.create_single_button(
                         text=self.locale.buttons.get("btn_back"),
                         callback_data="back_to_admin"
-                    )
+                    ),
+                    parse_mode=ParseMode.MARKDOWN
                 )
             await state.clear()
 
         except Exception as e:
             self.logger.error(f"Ошибка при подтверждении удаления: {str(e)}", exc_info=True)
-            await AdminMessageSender().send_or_edit_message(
+            await AdminMessageSender.send_or_edit_message(
                 target=callback,
                 text=self.locale.bot.get("error_delete_user_desc"),
                 reply_markup=self.keyboard.create_single_button(
                     text=self.locale.buttons.get("btn_back"),
                     callback_data="back_to_admin"
-                )
+                ),
+                parse_mode=ParseMode.MARKDOWN
             )
             await state.clear()
 
@@ -374,13 +390,14 @@ class UsersManagerService:
             self.logger.debug(f"Получено {len(users)} пользователей из БД")
 
             if not users:
-                await AdminMessageSender().send_or_edit_message(
+                await AdminMessageSender.send_or_edit_message(
                     target=callback,
                     text=self.locale.ui.get("users_list_empty"),
                     reply_markup=self.keyboard.create_single_button(
                         text=self.locale.buttons.get("btn_back"),
                         callback_data="back_to_admin"
-                    )
+                    ),
+                    parse_mode=ParseMode.MARKDOWN
                 )
                 self.logger.info("Список пользователей пуст")
             else:
@@ -396,17 +413,19 @@ class UsersManagerService:
                         f"{i}. {role_icon} ID: `{user['user_id']}` | {username} | {first_name} | {role_text}"
                     )
 
-                text = self.locale.ui.get("users_list_desc").format(
+                text = self.locale.ui.render(
+                    "users_list_desc",
                     users=len(users),
                     users_text="\n".join(user_list)
                 )
-                await AdminMessageSender().send_or_edit_message(
+                await AdminMessageSender.send_or_edit_message(
                     target=callback,
                     text=text,
                     reply_markup=self.keyboard.create_single_button(
                         text=self.locale.buttons.get("btn_back"),
                         callback_data="back_to_admin"
-                    )
+                    ),
+                    parse_mode=ParseMode.MARKDOWN
                 )
                 self.logger.info(f"Список из {len(users)} пользователей отправлен админу {callback.from_user.id}")
 
@@ -454,19 +473,21 @@ class UsersManagerService:
             )
 
             if result == ErrorCode.SUCCESSFUL:
-                text = self.locale.ui.get("user_add_successful_desc").format(
+                text = self.locale.ui.render(
+                    "user_add_successful_desc",
                     user_id=user_id,
                     username=username if username else "не указан",
                     role="Пользователь" if role == UserRole.USER else "Админ"
                 )
 
-                await AdminMessageSender().send_or_edit_message(
+                await AdminMessageSender.send_or_edit_message(
                     target=callback,
                     text=text,
                     reply_markup=self.keyboard.create_single_button(
                         text=self.locale.buttons.get("btn_back"),
                         callback_data="back_to_admin"
-                    )
+                    ),
+                    parse_mode=ParseMode.MARKDOWN
                 )
 
                 admin_username = f"@{callback.from_user.username}" if callback.from_user.username else callback.from_user.full_name
@@ -476,13 +497,14 @@ class UsersManagerService:
                 )
             else:
                 self.logger.error(f"Ошибка при добавлении пользователя {user_id}: {result}")
-                await AdminMessageSender().send_or_edit_message(
+                await AdminMessageSender.send_or_edit_message(
                     target=callback,
                     text=self.locale.bot.get("error_add_user"),
                     reply_markup=self.keyboard.create_single_button(
                         text=self.locale.buttons.get("btn_back"),
                         callback_data="back_to_admin"
-                    )
+                    ),
+                    parse_mode=ParseMode.MARKDOWN
                 )
             await state.clear()
             self.logger.debug(f"Состояние очищено для админа {callback.from_user.id}")
@@ -1 +1 @@
-from .load_config import load_config
+from .load_config import load_config, load_config_async
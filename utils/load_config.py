@@ -1,5 +1,9 @@
-import json
+import asyncio
 from pathlib import Path
+from typing import Any
+
+import aiofiles
+import orjson
 
 from const import PathLike
 from logger import Logger
@@ -7,21 +11,84 @@ from logger import Logger
 
 logger = Logger().get_logger()
 
+# Кэш прочитанных конфигов, общий для синхронной и асинхронной загрузки (ключ - абсолютный путь к файлу).
+# Ошибка чтения не кэшируется
+_cache: dict[str, dict[str, Any]] = {}
+# Выполняющиеся асинхронные чтения: одновременные запросы одного файла ждут одно чтение,
+# разные файлы читаются параллельно
+_pending: dict[str, asyncio.Future] = {}
+
+
+def _store(config_path: str, raw: bytes) -> dict:
+    """
+    Разбирает содержимое конфига и сохраняет результат в кэш
+
+    :param config_path: Абсолютный путь к конфигу
+    :param raw: Содержимое файла
+    :return: Данные из конфига в виде словаря
+    """
+    data = orjson.loads(raw)
+    _cache[config_path] = data
+    logger.info("Конфиг %s успешно прочитан", config_path)
+    return data
+
 
 def load_config(config_file: PathLike) -> dict:
     """
-    Загрузка данных из конфига
+    Загрузка данных из конфига. Повторное чтение того же файла берется из кэша,
+    поэтому возвращаемый словарь нельзя изменять
+
+    :param config_file: Название конфиг файла через .json
+
+    :return: Данные из конфига в виде словаря
+    """
+    config_path = str(Path(config_file).absolute())
+    data = _cache.get(config_path)
+    if data is not None:
+        return data
+
+    try:
+        with open(config_path, "rb") as file:
+            raw = file.read()
+    except (FileNotFoundError, IsADirectoryError):
+        logger.error("Ошибка при загрузке конфига %s", config_file)
+        return {}
+    return _store(config_path, raw)
+
+
+async def _read_config_async(config_path: str) -> dict:
+    """
+    Читает и разбирает конфиг без блокировки цикла событий
+
+    :param config_path: Абсолютный путь к конфигу
+    :return: Данные из конфига в виде словаря
+    """
+    try:
+        async with aiofiles.open(config_path, "rb") as file:
+            raw = await file.read()
+    except (FileNotFoundError, IsADirectoryError):
+        logger.error("Ошибка при загрузке конфига %s", config_path)
+        return {}
+    return _store(config_path, raw)
+
+
+async def load_config_async(config_file: PathLike) -> dict:
+    """
+    Асинхронная загрузка данных из конфига, не блокирующая цикл событий.
+    Повторное чтение того же файла берется из кэша, поэтому возвращаемый словарь нельзя изменять
 
     :param config_file: Название конфиг файла через .json
 
     :return: Данные из конфига в виде словаря
     """
-    config_path = Path(config_file)
+    config_path = str(Path(config_file).absolute())
+    data = _cache.get(config_path)
+    if data is not None:
+        return data
 
-    if config_path.is_file():
-        with open(config_file) as file:
-            data = json.load(file)
-            logger.info(f"Конфиг {config_file} успешно прочитан")
-            return data
-    logger.error(f"Ошибка при загрузке конфига {config_file}")
-    return {}
+    future = _pending.get(config_path)
+    if future is None:
+        future = _pending[config_path] = asyncio.ensure_future(_read_config_async(config_path))
+        future.add_done_callback(lambda _: _pending.pop(config_path, None))
+    # Отмена одного ожидающего не должна отменять чтение для остальных
+    return await asyncio.shield(future)